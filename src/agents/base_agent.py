@@ -5,6 +5,7 @@ Provides abstract interface and auto-logging for all refactoring agents.
 
 from abc import ABC, abstractmethod
 import logging
+import threading
 from src.utils.logger import log_experiment, ActionType
 from src.utils.prompt_manager import PromptManager
 
@@ -15,6 +16,10 @@ class BaseAgent(ABC):
     Handles logging automatically; child agents focus on analysis/generation logic.
     """
 
+    # Shared by all agents: log_experiment rewrites the log file, so concurrent
+    # writers (e.g. the auditor's worker threads) must take turns
+    _log_lock = threading.Lock()
+
     def __init__(self, agent_name: str, model: str = "llama-3.3-70b-versatile"):
         """
         Initialize agent.
@@ -39,6 +44,9 @@ class BaseAgent(ABC):
             response: LLM response received
             extra_details: Optional additional fields to log (e.g., target_file, issues_found)
             status: "SUCCESS" or "FAILURE"
+            
+        Raises:
+            ValueError: If log_experiment rejects the entry
         """
         details = {
             "input_prompt": prompt,
@@ -49,13 +57,14 @@ class BaseAgent(ABC):
         if extra_details:
             details.update(extra_details)
         
-        log_experiment(
-            agent_name=self.agent_name,
-            model_used=self.model,
-            action=action,
-            details=details,
-            status=status
-        )
+        with BaseAgent._log_lock:
+            log_experiment(
+                agent_name=self.agent_name,
+                model_used=self.model,
+                action=action,
+                details=details,
+                status=status
+            )
 
     @abstractmethod
     def analyze(self, code: str, filename: str = "unknown.py") -> dict:
@@ -6,15 +6,84 @@ Responsable de la télémétrie et de la qualité des données.
 Valide que chaque action des agents est enregistrée correctement selon le schéma ENSI.
 """
 
+import io
 import json
+import mmap
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import List, Dict, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 LOG_FILE = Path("logs/experiment_data.json")
 
+# À partir de ce nombre d'entrées, les agrégations passent par pandas (si installé)
+VECTORIZE_THRESHOLD = 50_000
+
+# À partir de ce nombre d'entrées, la validation du schéma est répartie sur plusieurs processus
+PARALLEL_SCAN_THRESHOLD = 200_000
+
+
+def _import_pandas():
+    """Importe pandas à la demande : le module est lourd et rarement utile."""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
+
+def _count_column(column: List, pd=None) -> Counter:
+    """Compte les valeurs d'une colonne (value_counts vectorisé si pandas est fourni)."""
+    if pd is None:
+        return Counter(column)
+    counts = pd.Series(column, dtype=object).value_counts(dropna=False, sort=False)
+    return Counter(counts.to_dict())
+
+
+def _group_duplicates(agents: List, actions: List, timestamps: List, pd=None) -> Dict:
+    """
+    Regroupe les indices par agent+action+timestamp (à la minute).
+    La clé texte séparée par US (\\x1f) est plus rapide à hacher qu'un tuple.
+    Une clé vue une seule fois garde un int ; une liste n'est créée qu'au
+    premier doublon. Avec pandas, seules les lignes marquées par
+    duplicated() sont regroupées.
+    """
+    indices = range(len(agents))
+    if pd is not None:
+        frame = pd.DataFrame({
+            'agent': pd.Series(agents, dtype=object),
+            'action': pd.Series(actions, dtype=object),
+            'minute': pd.Series(timestamps, dtype=object).str[:16]
+        })
+        indices = frame.index[frame.duplicated(keep=False)].tolist()
+    
+    dup_map = {}
+    for idx in indices:
+        key = f"{agents[idx]}\x1f{actions[idx]}\x1f{timestamps[idx][:16]}"
+        bucket = dup_map.get(key)
+        if bucket is None:
+            dup_map[key] = idx
+        elif isinstance(bucket, int):
+            dup_map[key] = [bucket, idx]
+        else:
+            bucket.append(idx)
+    return dup_map
+
+
 class DataOfficer:
     """Gestionnaire de qualité des données et télémétrie."""
     
@@ -33,216 +102,248 @@ class DataOfficer:
     
     VALID_STATUSES = {'SUCCESS', 'FAILURE'}
     
+    # Attributs cached_property invalidés à chaque load_logs()
+    _CACHED_ANALYSES = ('_schema_scan', 'schema_valid', 'duplicates', 'statistics')
+    
     def __init__(self):
         self.logs = []
+        # Colonnes (SoA) des champs lus par les statistiques et les doublons
+        self.agent_names = []
+        self.models_used = []
+        self.actions = []
+        self.statuses = []
+        self.timestamps = []
         self.validation_issues = []
         self.warnings = []
+        self._schema_reported = False
         self.load_logs()
     
     def load_logs(self) -> bool:
-        """Charge les logs depuis experiment_data.json."""
+        """
+        Charge les logs depuis experiment_data.json.
+        orjson (s'il est installé) décode le fichier projeté en mémoire
+        (mmap) sans copie intermédiaire.
+        """
+        # Les diagnostics et analyses en cache portent sur les logs précédents
+        for name in self._CACHED_ANALYSES:
+            self.__dict__.pop(name, None)
+        self.validation_issues.clear()
+        self.warnings.clear()
+        self._schema_reported = False
+        
         if not LOG_FILE.exists():
+            self.logs = []
+            self._build_columns()
             self.warnings.append("⚠️ Fichier de logs n'existe pas encore")
             return False
         
         try:
-            with open(LOG_FILE, 'r', encoding='utf-8') as f:
-                self.logs = json.load(f)
+            size = LOG_FILE.stat().st_size
+            with open(LOG_FILE, 'rb') as f:
+                if orjson is not None and size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            self.logs = orjson.loads(view)
+                elif orjson is not None:
+                    self.logs = orjson.loads(f.read())
+                else:
+                    self.logs = json.load(f)
+            self._build_columns()
             return True
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError en dérive
             self.validation_issues.append(f"❌ JSON CORROMPU: {e}")
             return False
         except Exception as e:
             self.validation_issues.append(f"❌ Erreur de lecture: {e}")
             return False
     
-    def validate_schema(self) -> bool:
+    def _build_columns(self) -> None:
+        """Extrait une fois, en listes parallèles, les champs agrégés par les analyses."""
+        logs = self.logs
+        self.agent_names = [e.get('agent_name', 'UNKNOWN') for e in logs]
+        self.models_used = [e.get('model_used', 'UNKNOWN') for e in logs]
+        self.actions = [e.get('action', 'UNKNOWN') for e in logs]
+        self.statuses = [e.get('status', 'UNKNOWN') for e in logs]
+        self.timestamps = [e.get('timestamp') or '' for e in logs]
+    
+    def _pandas(self):
+        """Renvoie pandas si le volume de logs justifie la vectorisation, sinon None."""
+        return _import_pandas() if len(self.logs) >= VECTORIZE_THRESHOLD else None
+    
+    @cached_property
+    def _schema_scan(self) -> Tuple[bool, List[str], List[str]]:
         """
-        Valide que tous les logs respectent le schéma ENSI.
-        Retourne True si 100% conformité, False sinon.
+        Vérifie le schéma de chaque entrée en une passe.
+        Retourne (conforme, erreurs, avertissements).
+        Au-delà de PARALLEL_SCAN_THRESHOLD entrées, la passe est répartie
+        par tranches sur plusieurs processus.
         """
-        all_valid = True
+        logs = self.logs
+        workers = os.cpu_count() or 1
+        if len(logs) < PARALLEL_SCAN_THRESHOLD or workers < 2:
+            return _scan_entries(logs)
         
-        for idx, entry in enumerate(self.logs):
-            # Vérifier champs top-level
-            missing_fields = self.REQUIRED_TOP_FIELDS - set(entry.keys())
-            if missing_fields:
-                self.validation_issues.append(
-                    f"❌ Entrée {idx}: Champs manquants {missing_fields}"
-                )
-                all_valid = False
-            
-            # Vérifier action valide
-            action = entry.get('action')
-            if action not in self.VALID_ACTIONS:
-                self.validation_issues.append(
-                    f"❌ Entrée {idx}: Action invalide '{action}' (acceptées: {self.VALID_ACTIONS})"
-                )
-                all_valid = False
-            
-            # Vérifier statut valide
-            status = entry.get('status')
-            if status not in self.VALID_STATUSES:
-                self.validation_issues.append(
-                    f"❌ Entrée {idx}: Statut invalide '{status}' (acceptés: {self.VALID_STATUSES})"
-                )
-                all_valid = False
-            
-            # Vérifier champs details
-            details = entry.get('details', {})
-            missing_details = self.REQUIRED_DETAILS_FIELDS - set(details.keys())
-            if missing_details:
-                self.validation_issues.append(
-                    f"❌ Entrée {idx}: 'details' manque {missing_details}"
-                )
-                all_valid = False
-            
-            # Vérifier que prompt/response ne sont pas vides
-            input_prompt = details.get('input_prompt', '')
-            output_response = details.get('output_response', '')
-            
-            if input_prompt and len(str(input_prompt).strip()) < 10:
-                self.warnings.append(
-                    f"⚠️ Entrée {idx}: input_prompt très court ({len(input_prompt)} chars)"
-                )
-            
-            if output_response and len(str(output_response).strip()) < 5:
-                self.warnings.append(
-                    f"⚠️ Entrée {idx}: output_response très court ({len(output_response)} chars)"
-                )
+        shard_size = -(-len(logs) // workers)
+        starts = range(0, len(logs), shard_size)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    _scan_entries,
+                    [logs[i:i + shard_size] for i in starts],
+                    starts
+                ))
+        except (OSError, BrokenProcessPool):
+            return _scan_entries(logs)
         
-        return all_valid
+        # Fusion dans l'ordre des tranches : diagnostics identiques au mode séquentiel
+        issues = []
+        warnings = []
+        for _, shard_issues, shard_warnings in results:
+            issues.extend(shard_issues)
+            warnings.extend(shard_warnings)
+        return all(valid for valid, _, _ in results), issues, warnings
     
-    def detect_duplicates(self) -> List[str]:
-        """Détecte les entrées dupliquées par agent+action+timestamp."""
+    @cached_property
+    def schema_valid(self) -> bool:
+        """True si toutes les entrées respectent le schéma ENSI."""
+        return self._schema_scan[0]
+    
+    @cached_property
+    def duplicates(self) -> List[str]:
+        """Messages décrivant les groupes d'entrées potentiellement dupliquées."""
+        dup_map = _group_duplicates(self.agent_names, self.actions, self.timestamps, self._pandas())
         duplicates = []
-        seen = defaultdict(list)
         
-        for idx, entry in enumerate(self.logs):
-            key = (
-                entry.get('agent_name'),
-                entry.get('action'),
-                entry.get('timestamp')[:16]  # Grouper par minute
-            )
-            seen[key].append(idx)
-        
-        for key, indices in seen.items():
-            if len(indices) > 1:
+        for key, indices in dup_map.items():
+            if isinstance(indices, list):
+                agent, action, minute = key.split('\x1f', 2)
                 duplicates.append(
                     f"⚠️ Logs potentiellement dupliqués: "
-                    f"Agent={key[0]}, Action={key[1]}, Time={key[2]} (indices: {indices})"
+                    f"Agent={agent}, Action={action}, Time={minute} (indices: {indices})"
                 )
         
         return duplicates
     
-    def get_statistics(self) -> Dict:
-        """Calcule les statistiques d'exécution."""
-        stats = {
-            'total_entries': len(self.logs),
-            'success_rate': 0.0,
-            'agents': defaultdict(int),
-            'models': defaultdict(int),
-            'actions': defaultdict(int),
-            'status_distribution': defaultdict(int)
+    @cached_property
+    def statistics(self) -> Dict:
+        """Statistiques d'exécution calculées sur les colonnes."""
+        pd = self._pandas()
+        total = len(self.logs)
+        statuses = _count_column(self.statuses, pd)
+        return {
+            'total_entries': total,
+            'success_rate': (statuses['SUCCESS'] / total) * 100 if total else 0.0,
+            'agents': _count_column(self.agent_names, pd),
+            'models': _count_column(self.models_used, pd),
+            'actions': _count_column(self.actions, pd),
+            'status_distribution': statuses
         }
+    
+    def validate_schema(self, early_exit: bool = False) -> bool:
+        """
+        Valide que tous les logs respectent le schéma ENSI.
+        Retourne True si 100% conformité, False sinon.
         
-        if not self.logs:
-            return stats
-        
-        success_count = 0
-        
-        for entry in self.logs:
-            agent = entry.get('agent_name', 'UNKNOWN')
-            model = entry.get('model_used', 'UNKNOWN')
-            action = entry.get('action', 'UNKNOWN')
-            status = entry.get('status', 'UNKNOWN')
-            
-            stats['agents'][agent] += 1
-            stats['models'][model] += 1
-            stats['actions'][action] += 1
-            stats['status_distribution'][status] += 1
-            
-            if status == 'SUCCESS':
-                success_count += 1
-        
-        stats['success_rate'] = (success_count / len(self.logs)) * 100 if self.logs else 0
+        Avec early_exit=True, s'arrête à la première entrée non conforme sans
+        produire de diagnostics (suffisant pour un simple verdict).
+        """
+        if early_exit and '_schema_scan' not in self.__dict__:
+            return all(map(_entry_conforms, self.logs))
         
-        return stats
+        all_valid, issues, warnings = self._schema_scan
+        if not self._schema_reported:
+            self.validation_issues.extend(issues)
+            self.warnings.extend(warnings)
+            self._schema_reported = True
+        return all_valid
+    
+    def detect_duplicates(self) -> List[str]:
+        """Détecte les entrées dupliquées par agent+action+timestamp."""
+        return list(self.duplicates)
+    
+    def get_statistics(self) -> Dict:
+        """Calcule les statistiques d'exécution."""
+        # Copie (compteurs imbriqués compris) : le cache reste intact
+        return {
+            key: value.copy() if isinstance(value, dict) else value
+            for key, value in self.statistics.items()
+        }
     
     def generate_report(self) -> str:
         """Génère un rapport de conformité ENSI."""
-        report = []
-        report.append("\n" + "=" * 80)
-        report.append("RAPPORT DATA OFFICER - CONFORMITÉ ENSI")
-        report.append("=" * 80)
+        buf = io.StringIO()
+        w = buf.write
+        w("\n" + "=" * 80 + "\n")
+        w("RAPPORT DATA OFFICER - CONFORMITÉ ENSI\n")
+        w("=" * 80 + "\n")
         
         # Section 1: Existence du fichier
-        report.append("\n[1] PRÉSENCE DU FICHIER DE LOGS")
+        w("\n[1] PRÉSENCE DU FICHIER DE LOGS\n")
         if LOG_FILE.exists():
             size = LOG_FILE.stat().st_size
-            report.append(f"✅ logs/experiment_data.json existe ({size} bytes)")
+            w(f"✅ logs/experiment_data.json existe ({size} bytes)\n")
         else:
-            report.append("❌ logs/experiment_data.json ABSENT")
-            return "\n".join(report)
+            w("❌ logs/experiment_data.json ABSENT")
+            return buf.getvalue()
         
         # Section 2: Validité du schéma
-        report.append("\n[2] VALIDATION DU SCHÉMA ENSI")
+        w("\n[2] VALIDATION DU SCHÉMA ENSI\n")
         schema_valid = self.validate_schema()
         if schema_valid:
-            report.append("✅ Schéma VALIDE - 100% conformité")
+            w("✅ Schéma VALIDE - 100% conformité\n")
         else:
-            report.append(f"❌ {len(self.validation_issues)} erreurs détectées:")
+            w(f"❌ {len(self.validation_issues)} erreurs détectées:\n")
             for issue in self.validation_issues[:10]:
-                report.append(f"   {issue}")
+                w(f"   {issue}\n")
             if len(self.validation_issues) > 10:
-                report.append(f"   ... et {len(self.validation_issues) - 10} autres")
+                w(f"   ... et {len(self.validation_issues) - 10} autres\n")
         
         # Section 3: Doublons
-        report.append("\n[3] DÉTECTION DE DOUBLONS")
+        w("\n[3] DÉTECTION DE DOUBLONS\n")
         duplicates = self.detect_duplicates()
         if not duplicates:
-            report.append("✅ Aucun doublon détecté")
+            w("✅ Aucun doublon détecté\n")
         else:
-            report.append(f"⚠️  {len(duplicates)} potentiels doublons:")
+            w(f"⚠️  {len(duplicates)} potentiels doublons:\n")
             for dup in duplicates[:5]:
-                report.append(f"   {dup}")
+                w(f"   {dup}\n")
         
         # Section 4: Statistiques
-        report.append("\n[4] STATISTIQUES")
+        w("\n[4] STATISTIQUES\n")
         stats = self.get_statistics()
-        report.append(f"✅ Total entrées: {stats['total_entries']}")
-        report.append(f"✅ Taux de succès: {stats['success_rate']:.1f}%")
-        report.append(f"✅ Agents actifs: {len(stats['agents'])}")
+        w(f"✅ Total entrées: {stats['total_entries']}\n")
+        w(f"✅ Taux de succès: {stats['success_rate']:.1f}%\n")
+        w(f"✅ Agents actifs: {len(stats['agents'])}\n")
         for agent, count in sorted(stats['agents'].items()):
-            report.append(f"   - {agent}: {count} opérations")
-        report.append(f"✅ Modèles utilisés: {len(stats['models'])}")
+            w(f"   - {agent}: {count} opérations\n")
+        w(f"✅ Modèles utilisés: {len(stats['models'])}\n")
         for model, count in sorted(stats['models'].items()):
-            report.append(f"   - {model}: {count} opérations")
+            w(f"   - {model}: {count} opérations\n")
         
         # Section 5: Distribution des actions
-        report.append("\n[5] DISTRIBUTION DES ACTIONS")
+        w("\n[5] DISTRIBUTION DES ACTIONS\n")
         for action, count in sorted(stats['actions'].items()):
-            report.append(f"   - {action}: {count}")
+            w(f"   - {action}: {count}\n")
         
         # Section 6: Avertissements
         if self.warnings:
-            report.append("\n[6] AVERTISSEMENTS")
+            w("\n[6] AVERTISSEMENTS\n")
             for warning in self.warnings[:5]:
-                report.append(f"   {warning}")
+                w(f"   {warning}\n")
             if len(self.warnings) > 5:
-                report.append(f"   ... et {len(self.warnings) - 5} autres")
+                w(f"   ... et {len(self.warnings) - 5} autres\n")
         
         # Section 7: Conformité finale
-        report.append("\n[7] STATUT FINAL")
+        w("\n[7] STATUT FINAL\n")
         if schema_valid and stats['success_rate'] == 100 and not duplicates:
-            report.append("✅ ✅ ✅ CONFORME AUX SPÉCIFICATIONS ENSI ✅ ✅ ✅")
+            w("✅ ✅ ✅ CONFORME AUX SPÉCIFICATIONS ENSI ✅ ✅ ✅\n")
         elif schema_valid and stats['success_rate'] >= 95:
-            report.append("⚠️  GLOBALEMENT CONFORME (quelques avertissements mineurs)")
+            w("⚠️  GLOBALEMENT CONFORME (quelques avertissements mineurs)\n")
         else:
-            report.append("❌ NON CONFORME - Corrections requises")
+            w("❌ NON CONFORME - Corrections requises\n")
         
-        report.append("\n" + "=" * 80)
-        return "\n".join(report)
+        w("\n" + "=" * 80)
+        return buf.getvalue()
     
     def verify_data_integrity(self) -> Tuple[bool, str]:
         """
@@ -255,6 +356,9 @@ class DataOfficer:
         if not self.logs:
             return False, "❌ Fichier de logs est vide"
         
+        if not self.validate_schema(early_exit=True):
+            return False, "❌ Schéma ENSI non respecté"
+        
         all_issues = self.validation_issues + self.warnings
         if all_issues:
             return False, f"❌ {len(all_issues)} problèmes détectés"
@@ -266,6 +370,136 @@ class DataOfficer:
         return True, "✅ Intégrité des données VALIDÉE"
 
 
+# Versions figées du schéma, utilisées pour les tests d'appartenance de _schema_scan
+_REQUIRED_TOP = frozenset(DataOfficer.REQUIRED_TOP_FIELDS)
+_REQUIRED_DETAILS = frozenset(DataOfficer.REQUIRED_DETAILS_FIELDS)
+_VALID_ACTIONS = frozenset(DataOfficer.VALID_ACTIONS)
+_VALID_STATUSES = frozenset(DataOfficer.VALID_STATUSES)
+
+# Schéma ENSI déclaratif, compilé une seule fois quand fastjsonschema est disponible
+ENTRY_SCHEMA = {
+    'type': 'object',
+    'required': sorted(DataOfficer.REQUIRED_TOP_FIELDS),
+    'properties': {
+        'action': {'enum': sorted(DataOfficer.VALID_ACTIONS)},
+        'status': {'enum': sorted(DataOfficer.VALID_STATUSES)},
+        'details': {
+            'type': 'object',
+            'required': sorted(DataOfficer.REQUIRED_DETAILS_FIELDS)
+        }
+    }
+}
+_ENTRY_VALIDATOR = fastjsonschema.compile(ENTRY_SCHEMA) if fastjsonschema is not None else None
+
+
+def _scan_entries(entries: List[Dict], start: int = 0) -> Tuple[bool, List[str], List[str]]:
+    """
+    Vérifie le schéma d'une tranche d'entrées (indices numérotés à partir de start).
+    Retourne (conforme, erreurs, avertissements). Fonction de module pour
+    pouvoir être exécutée dans un processus de travail.
+    """
+    # Liaisons locales : évite les recherches d'attributs dans la boucle
+    required_top = _REQUIRED_TOP
+    required_details = _REQUIRED_DETAILS
+    valid_actions = _VALID_ACTIONS
+    valid_statuses = _VALID_STATUSES
+    issue_formatters = _ISSUE_FORMATTERS
+    
+    issues = []
+    warnings = []
+    add_issue = issues.append
+    add_warning = warnings.append
+    all_valid = True
+    
+    for idx, entry in enumerate(entries, start):
+        raw_details = entry.get('details', {})
+        # Un 'details' qui n'est pas un objet viole la règle details (comme
+        # pour le schéma compilé) ; ses champs comptent alors comme absents
+        details = raw_details if isinstance(raw_details, dict) else {}
+    
+        # Un bit par règle violée : champs top-level, action, statut, details.
+        # Les messages ne sont formatés que pour les entrées non conformes.
+        mask = (
+            (not required_top <= entry.keys())
+            | (entry.get('action') not in valid_actions) << 1
+            | (entry.get('status') not in valid_statuses) << 2
+            | (details is not raw_details or not required_details <= details.keys()) << 3
+        )
+        if mask:
+            all_valid = False
+            for bit, describe in enumerate(issue_formatters):
+                if mask >> bit & 1:
+                    add_issue(describe(idx, entry, details))
+    
+        # Vérifier que prompt/response ne sont pas vides
+        input_prompt = details.get('input_prompt', '')
+        output_response = details.get('output_response', '')
+    
+        if input_prompt and len(str(input_prompt).strip()) < 10:
+            add_warning(
+                f"⚠️ Entrée {idx}: input_prompt très court ({len(input_prompt)} chars)"
+            )
+    
+        if output_response and len(str(output_response).strip()) < 5:
+            add_warning(
+                f"⚠️ Entrée {idx}: output_response très court ({len(output_response)} chars)"
+            )
+    
+    return all_valid, issues, warnings
+
+
+def _missing_fields_issue(idx: int, entry: Dict, details: Dict) -> str:
+    """Champs top-level manquants."""
+    return f"❌ Entrée {idx}: Champs manquants {DataOfficer.REQUIRED_TOP_FIELDS - entry.keys()}"
+
+
+def _invalid_action_issue(idx: int, entry: Dict, details: Dict) -> str:
+    """Action hors de VALID_ACTIONS."""
+    return (
+        f"❌ Entrée {idx}: Action invalide '{entry.get('action')}' "
+        f"(acceptées: {DataOfficer.VALID_ACTIONS})"
+    )
+
+
+def _invalid_status_issue(idx: int, entry: Dict, details: Dict) -> str:
+    """Statut hors de VALID_STATUSES."""
+    return (
+        f"❌ Entrée {idx}: Statut invalide '{entry.get('status')}' "
+        f"(acceptés: {DataOfficer.VALID_STATUSES})"
+    )
+
+
+def _missing_details_issue(idx: int, entry: Dict, details: Dict) -> str:
+    """Champs manquants dans 'details'."""
+    return f"❌ Entrée {idx}: 'details' manque {DataOfficer.REQUIRED_DETAILS_FIELDS - details.keys()}"
+
+
+# Formateurs de diagnostics, indexés par bit du masque calculé dans _schema_scan
+_ISSUE_FORMATTERS = (
+    _missing_fields_issue,
+    _invalid_action_issue,
+    _invalid_status_issue,
+    _missing_details_issue,
+)
+
+
+def _entry_conforms(entry: Dict) -> bool:
+    """Verdict rapide, sans diagnostic, de conformité d'une entrée au schéma ENSI."""
+    if _ENTRY_VALIDATOR is not None:
+        try:
+            _ENTRY_VALIDATOR(entry)
+            return True
+        except fastjsonschema.JsonSchemaException:
+            return False
+    return (
+        _REQUIRED_TOP <= entry.keys()
+        and entry.get('action') in _VALID_ACTIONS
+        and entry.get('status') in _VALID_STATUSES
+        and isinstance(entry['details'], dict)
+        and _REQUIRED_DETAILS <= entry['details'].keys()
+    )
+
+
 def print_data_officer_report():
     """Affiche le rapport Data Officer."""
     officer = DataOfficer()
@@ -4,7 +4,7 @@ Orchestration Package - Lead Developer (Orchestrator) components
 - Orchestration logic (Feature 2)
 """
 
-from src.orchestration.execution_graph import ExecutionGraph, ExecutionState
+from src.orchestration.execution_graph import ExecutionGraph, ExecutionState, Step
 from src.orchestration.orchestrator import Orchestrator
 
-__all__ = ['ExecutionGraph', 'ExecutionState', 'Orchestrator']
+__all__ = ['ExecutionGraph', 'ExecutionState', 'Step', 'Orchestrator']
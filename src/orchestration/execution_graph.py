@@ -5,6 +5,7 @@ with feedback loop (Judge failure → Fixer retry, Judge success → stop)
 Maximum 10 iterations constraint.
 """
 
+from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Dict, Any, List
 
@@ -20,6 +21,22 @@ class ExecutionState(Enum):
     ERROR = "ERROR"
 
 
+@dataclass(slots=True)
+class Step:
+    """One recorded step of the graph traversal"""
+    iteration: int
+    state: str
+    result: Dict[str, Any]
+
+
+# Unconditional edges of the graph (JUDGE depends on the judge decision)
+_TRANSITIONS: Dict[ExecutionState, ExecutionState] = {
+    ExecutionState.INIT: ExecutionState.AUDIT,
+    ExecutionState.AUDIT: ExecutionState.FIX,
+    ExecutionState.FIX: ExecutionState.JUDGE,
+}
+
+
 class ExecutionGraph:
     """
     Defines the execution flow:
@@ -38,7 +55,7 @@ class ExecutionGraph:
     def __init__(self):
         self.current_state = ExecutionState.INIT
         self.iteration_count = 0
-        self.history: List[Dict[str, Any]] = []
+        self.history: List[Step] = []
     
     def get_next_state(self, current_state: ExecutionState, judge_decision: bool = None) -> ExecutionState:
         """
@@ -51,16 +68,11 @@ class ExecutionGraph:
         Returns:
             Next state in the graph
         """
-        if current_state == ExecutionState.INIT:
-            return ExecutionState.AUDIT
-        
-        elif current_state == ExecutionState.AUDIT:
-            return ExecutionState.FIX
+        next_state = _TRANSITIONS.get(current_state)
+        if next_state is not None:
+            return next_state
         
-        elif current_state == ExecutionState.FIX:
-            return ExecutionState.JUDGE
-        
-        elif current_state == ExecutionState.JUDGE:
+        if current_state == ExecutionState.JUDGE:
             # Judge decision determines next path
             if judge_decision is True:
                 return ExecutionState.SUCCESS
@@ -77,11 +89,7 @@ class ExecutionGraph:
     
     def record_step(self, state: ExecutionState, result: Dict[str, Any]):
         """Record execution step in history"""
-        self.history.append({
-            'iteration': self.iteration_count,
-            'state': state.value,
-            'result': result
-        })
+        self.history.append(Step(self.iteration_count, state.value, result))
     
     def can_continue(self) -> bool:
         """Check if execution can continue (respects max iterations)"""
@@ -91,11 +99,16 @@ class ExecutionGraph:
         """Increment iteration counter"""
         self.iteration_count += 1
     
-    def get_execution_summary(self) -> Dict[str, Any]:
-        """Get summary of execution graph traversal"""
+    def get_execution_summary(self, as_dict: bool = False) -> Dict[str, Any]:
+        """
+        Get summary of execution graph traversal.
+        
+        Args:
+            as_dict: Convert steps to plain dicts (for JSON output)
+        """
         return {
             'total_iterations': self.iteration_count,
             'max_allowed_iterations': self.MAX_ITERATIONS,
             'max_reached': self.iteration_count >= self.MAX_ITERATIONS,
-            'steps': self.history
+            'steps': [asdict(step) for step in self.history] if as_dict else list(self.history)
         }
@@ -4,7 +4,9 @@ Implement the execution of the defined graph.
 Call agents sequentially and handle iteration/stopping conditions.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import copy
+from typing import Dict, Any, List, Optional
 from src.orchestration.execution_graph import ExecutionGraph, ExecutionState
 
 
@@ -91,6 +93,33 @@ class Orchestrator:
         self.graph.current_state = ExecutionState.MAX_ITERATIONS
         return self._max_iterations_result()
     
+    async def run_many(self, target_directories: List[str]) -> List[Dict[str, Any]]:
+        """
+        Execute the workflow on several directories concurrently.
+        
+        Within one directory the graph is strictly sequential (the fixer needs
+        the audit, the judge needs the fix), so concurrency happens across
+        directories: each one gets its own Orchestrator (and ExecutionGraph)
+        and runs in a worker thread so the blocking LLM/pytest calls overlap.
+        The agents keep per-call state on self (readers, runners), so every
+        directory works on its own shallow copy of each agent.
+        
+        Args:
+            target_directories: Directories containing code to refactor
+            
+        Returns:
+            One execution result per directory, in input order
+        """
+        async def run_one(directory: str) -> Dict[str, Any]:
+            worker = Orchestrator(copy.copy(self.auditor), copy.copy(self.fixer), copy.copy(self.judge))
+            return await asyncio.to_thread(worker.run, directory)
+        
+        return list(await asyncio.gather(*(run_one(d) for d in target_directories)))
+    
+    def run_batch(self, target_directories: List[str]) -> List[Dict[str, Any]]:
+        """Synchronous entry point for run_many (starts its own event loop)."""
+        return asyncio.run(self.run_many(target_directories))
+    
     def _run_audit(self, target_directory: str) -> Dict[str, Any]:
         """Call AuditorAgent"""
         try:
@@ -115,6 +144,13 @@ class Orchestrator:
         except Exception as e:
             return {'status': 'ERROR', 'message': f'Judge error: {str(e)}'}
     
+    def _history(self) -> List[Dict[str, Any]]:
+        """Recorded steps as plain dicts (iteration, state, result), ready for json.dumps"""
+        return [
+            {'iteration': step.iteration, 'state': step.state, 'result': step.result}
+            for step in self.graph.history
+        ]
+    
     def _success_result(self, judge_result: Dict[str, Any]) -> Dict[str, Any]:
         """Format success result"""
         return {
@@ -122,7 +158,7 @@ class Orchestrator:
             'state': ExecutionState.SUCCESS.value,
             'iterations': self.graph.iteration_count,
             'judge_result': judge_result,
-            'history': self.graph.history
+            'history': self._history()
         }
     
     def _error_result(self, message: str, detail: Dict[str, Any]) -> Dict[str, Any]:
@@ -133,7 +169,7 @@ class Orchestrator:
             'message': message,
             'detail': detail,
             'iterations': self.graph.iteration_count,
-            'history': self.graph.history
+            'history': self._history()
         }
     
     def _max_iterations_result(self) -> Dict[str, Any]:
@@ -143,5 +179,5 @@ class Orchestrator:
             'state': ExecutionState.MAX_ITERATIONS.value,
             'iterations': self.graph.iteration_count,
             'max_allowed': ExecutionGraph.MAX_ITERATIONS,
-            'history': self.graph.history
+            'history': self._history()
         }
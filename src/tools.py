@@ -7,8 +7,28 @@ import json
 import shutil
 import time
 import inspect
+import hashlib
+import io
+import tokenize
+import importlib
+import importlib.metadata
+import importlib.util
+import mmap
+import stat
+import threading
+import asyncio
+import queue
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional, Callable
+from typing import List, Tuple, Dict, Any, Optional, Callable, Union
+
+try:
+    from pylint.reporters.json_reporter import JSON2Reporter
+    # Shared with PylintRunner: in-process pylint runs must not overlap
+    from src.utils.pylint_runner import ASTROID_MANAGER, PylintRun, _IN_PROCESS_LOCK
+except ImportError:
+    PylintRun = None
 
 # Define the sandbox directory as an absolute path
 SANDBOX_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'sandbox'))
@@ -17,6 +37,112 @@ BACKUP_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '.san
 # Ensure sandbox directory exists
 os.makedirs(SANDBOX_DIR, exist_ok=True)
 
+# Precomputed once: every tool call validates against this prefix
+_SANDBOX_PREFIX = SANDBOX_DIR + os.sep
+
+# Set in every tool subprocess (see _subprocess_env)
+_SUBPROCESS_ENV_OVERRIDES = {"PYTHONDONTWRITEBYTECODE": "1", "PYTHONUNBUFFERED": "1"}
+
+# read_file maps files at least this large instead of streaming them
+MMAP_READ_THRESHOLD = 256 * 1024
+
+# read_file cache: abs_path -> ((mtime_ns, ctime_ns, size), content), LRU order.
+# ctime is part of the key because copy2-style restores preserve mtime.
+READ_CACHE_SIZE = 256
+_read_cache: "OrderedDict[str, Tuple[Tuple[int, int, int], str]]" = OrderedDict()
+_read_cache_lock = threading.Lock()
+
+# run_pylint_batch memo: abs_path -> ((mtime_ns, ctime_ns, size, sandbox version), result), LRU order
+PYLINT_CACHE_SIZE = 128
+_pylint_cache: "OrderedDict[str, Tuple[Tuple[int, int, int, int], Dict[str, Any]]]" = OrderedDict()
+_pylint_cache_lock = threading.Lock()
+
+# Whether pylint / pytest are importable by sys.executable, probed once at
+# import (pylint is already imported above when in-process runs are possible)
+_PYLINT_OK = PylintRun is not None or importlib.util.find_spec("pylint") is not None
+_PYTEST_OK = importlib.util.find_spec("pytest") is not None
+
+# Whether pylint has the json2 reporter; None until first needed
+_HAS_JSON2: Optional[bool] = None
+
+# run_pytest keeps only this many trailing lines of each output stream
+OUTPUT_TAIL_LINES = 2000
+
+# Warm pytest interpreter used by run_pytest (started on first use)
+PYTEST_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils', 'pytest_worker.py')
+_pytest_worker: "Optional[Tuple[subprocess.Popen, queue.Queue]]" = None
+_pytest_worker_lock = threading.Lock()
+
+# Score line of pylint's text report ("rated at 7.50/10")
+_SCORE_RE = re.compile(rb'rated at ([-\d.]+)/10')
+
+# "<n> passed" / "<n> failed" / "<n> error(s)" tallies of the pytest summary line
+_PYTEST_SUMMARY_RE = re.compile(r'(\d+) (passed|failed|error)s?\b')
+
+# analyze_code_quality memo: abs_path -> ((mtime_ns, ctime_ns, size, sandbox version), report), LRU order
+QUALITY_CACHE_SIZE = 128
+_quality_cache: "OrderedDict[str, Tuple[Tuple[int, int, int, int], Dict[str, Any]]]" = OrderedDict()
+_quality_cache_lock = threading.Lock()
+
+# check_syntax memo: blake2b(source) -> (is_valid, message, tree), LRU order
+SYNTAX_CACHE_SIZE = 256
+_syntax_cache: "OrderedDict[bytes, Tuple[bool, str, Optional[ast.Module]]]" = OrderedDict()
+_syntax_cache_lock = threading.Lock()
+
+# apply_black_formatting memo: (blake2b(source), line_length) -> (formatted source, reformatted), LRU order
+FORMAT_CACHE_SIZE = 256
+_format_cache: "OrderedDict[Tuple[bytes, int], Tuple[bytes, bool]]" = OrderedDict()
+_format_cache_lock = threading.Lock()
+
+# black module, imported by _ensure_black_installed; None until then (or when
+# black only runs as a separate interpreter)
+_BLACK_MOD = None
+
+# Whether black is available, settled by the first _ensure_black_installed; None until then
+_BLACK_STATE: Optional[bool] = None
+
+# Files per `python -m black` invocation in apply_black_formatting_batch (keeps argv bounded)
+BLACK_BATCH_SIZE = 128
+
+# list_backups stats at least this many files from a pool of STAT_POOL_WORKERS threads
+STAT_POOL_THRESHOLD = 512
+STAT_POOL_WORKERS = 32
+
+# get_project_structure file icons by extension (anything else gets 📄)
+_EXT_ICONS = {
+    '.py': "🐍",
+    '.txt': "📄", '.md': "📄", '.rst': "📄",
+    '.json': "⚙️", '.yaml': "⚙️", '.yml': "⚙️", '.toml': "⚙️",
+}
+
+# get_project_structure memo: (abs_path, max_depth, show_hidden) ->
+# (((directory, mtime_ns), ...) listed, rendered tree), LRU order
+TREE_CACHE_SIZE = 64
+_tree_cache: "OrderedDict[Tuple[str, int, bool], Tuple[Tuple[Tuple[str, int], ...], str]]" = OrderedDict()
+_tree_cache_lock = threading.Lock()
+
+# Documentation generators: tool function -> (signature, docstring), and
+# (format_type, category) -> rendered documentation
+_tool_specs: Dict[Callable, Tuple[inspect.Signature, Optional[str]]] = {}
+_docs_cache: Dict[Tuple[str, Optional[str]], str] = {}
+
+def _subprocess_env() -> Dict[str, str]:
+    """
+    Environment for the pylint / pytest / script children: no .pyc writes
+    and unbuffered output (streamed readers see lines as they come).
+    
+    PYTHONNOUSERSITE is deliberately not set: tools or packages installed
+    with `pip install --user` would disappear from the child.
+    """
+    return {**os.environ, **_SUBPROCESS_ENV_OVERRIDES}
+
+
+def _decode_output(output: Union[str, bytes]) -> str:
+    """Decodes raw child output the way text-mode pipes would (UTF-8, LF newlines)."""
+    if isinstance(output, str):
+        return output
+    return output.decode('utf-8', 'replace').replace('\r\n', '\n')
+
 
 def validate_path(path: str) -> str:
     """
@@ -31,23 +157,50 @@ def validate_path(path: str) -> str:
     Raises:
         ValueError: If the path is outside the sandbox directory
     """
-    # Convert to absolute path
-    if not os.path.isabs(path):
-        abs_path = os.path.abspath(os.path.join(SANDBOX_DIR, path))
-    else:
-        abs_path = os.path.abspath(path)
-    
-    # Normalize paths to handle .. and . properly
-    abs_path = os.path.normpath(abs_path)
-    sandbox_norm = os.path.normpath(SANDBOX_DIR)
+    # join() keeps absolute paths as-is; a single normpath handles .. and .
+    # (SANDBOX_DIR is already absolute and normalized)
+    abs_path = os.path.normpath(os.path.join(SANDBOX_DIR, path))
     
     # Check if the path starts with the sandbox directory
-    if not abs_path.startswith(sandbox_norm + os.sep) and abs_path != sandbox_norm:
+    if abs_path != SANDBOX_DIR and not abs_path.startswith(_SANDBOX_PREFIX):
         raise ValueError(f"Access denied: Path '{path}' is outside the sandbox directory")
     
     return abs_path
 
 
+def _stat_file(path: str, not_found: str) -> Tuple[str, os.stat_result]:
+    """
+    Validates that path is an existing regular file within the sandbox.
+    
+    Args:
+        path: Path as given by the caller
+        not_found: Message prefix for the FileNotFoundError
+        
+    Returns:
+        The absolute path and its stat result
+        
+    Raises:
+        ValueError: If the path is outside the sandbox or is not a file
+        FileNotFoundError: If the file doesn't exist
+    """
+    abs_path = validate_path(path)
+    
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        raise FileNotFoundError(f"{not_found}: {path}")
+    
+    if not stat.S_ISREG(st.st_mode):
+        raise ValueError(f"Path is not a file: {path}")
+    
+    return abs_path, st
+
+
+def _require_file(path: str, not_found: str) -> str:
+    """Like _stat_file, for callers that only need the absolute path."""
+    return _stat_file(path, not_found)[0]
+
+
 def read_file(path: str) -> str:
     """
     Reads and returns the content of a file within the sandbox.
@@ -63,19 +216,45 @@ def read_file(path: str) -> str:
         FileNotFoundError: If the file doesn't exist
         PermissionError: If the file cannot be read
     """
-    abs_path = validate_path(path)
+    abs_path, st = _stat_file(path, "File not found")
     
-    if not os.path.exists(abs_path):
-        raise FileNotFoundError(f"File not found: {path}")
-    
-    if not os.path.isfile(abs_path):
-        raise ValueError(f"Path is not a file: {path}")
+    # Unchanged since the last read: serve the cached content
+    version = (st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    with _read_cache_lock:
+        cached = _read_cache.get(abs_path)
+        if cached is not None and cached[0] == version:
+            _read_cache.move_to_end(abs_path)
+            return cached[1]
     
     try:
-        with open(abs_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        if st.st_size >= MMAP_READ_THRESHOLD:
+            # Large files: decode straight from the mapped pages instead of
+            # going through the text-mode reader (newlines translated the same way)
+            with open(abs_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = mm[:].decode('utf-8')
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        else:
+            with open(abs_path, 'r', encoding='utf-8') as f:
+                content = f.read()
     except Exception as e:
         raise PermissionError(f"Cannot read file '{path}': {str(e)}")
+    
+    with _read_cache_lock:
+        _read_cache[abs_path] = (version, content)
+        _read_cache.move_to_end(abs_path)
+        if len(_read_cache) > READ_CACHE_SIZE:
+            _read_cache.popitem(last=False)
+    return content
+
+
+def _invalidate_read_cache(abs_path: Optional[str] = None) -> None:
+    """Drops one cached read_file entry, or the whole cache when no path is given."""
+    with _read_cache_lock:
+        if abs_path is None:
+            _read_cache.clear()
+        else:
+            _read_cache.pop(abs_path, None)
 
 
 def write_file(path: str, content: str) -> None:
@@ -100,6 +279,8 @@ def write_file(path: str, content: str) -> None:
             f.write(content)
     except Exception as e:
         raise PermissionError(f"Cannot write to file '{path}': {str(e)}")
+    finally:
+        _invalidate_read_cache(abs_path)
 
 
 def list_files(path: str = "") -> List[str]:
@@ -128,15 +309,26 @@ def list_files(path: str = "") -> List[str]:
         raise ValueError(f"Path is not a directory: {path}")
     
     file_list = []
+    # Every entry path starts with the sandbox prefix, so slicing makes it relative
+    prefix_len = len(_SANDBOX_PREFIX)
+    stack = [abs_path]
     
-    for root, dirs, files in os.walk(abs_path):
-        for file in files:
-            full_path = os.path.join(root, file)
-            # Make path relative to sandbox
-            rel_path = os.path.relpath(full_path, SANDBOX_DIR)
-            file_list.append(rel_path)
+    # Same traversal as os.walk (symlinked dirs listed, not followed;
+    # unreadable dirs skipped) but on raw scandir entries
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    else:
+                        file_list.append(entry.path[prefix_len:])
+        except OSError:
+            continue
     
-    return sorted(file_list)
+    file_list.sort()
+    return file_list
 
 
 # ============================================================================
@@ -155,9 +347,38 @@ def check_syntax(code_string: str) -> Tuple[bool, str]:
             - (True, "Valid") if syntax is correct
             - (False, error_message) if syntax errors are found
     """
+    is_valid, message, _ = _parse_cached(code_string)
+    return (is_valid, message)
+
+
+def _parse_cached(source: Union[str, bytes]) -> Tuple[bool, str, Optional[ast.Module]]:
+    """
+    Parses Python source once per distinct content.
+    
+    Repair loops re-check the same source many times, so results are
+    memoized on a blake2b digest of the code. The tree is shared between
+    callers and must not be mutated.
+    
+    Args:
+        source: Python code to parse, as text or as the raw bytes of a file
+                (whose encoding declaration is then honoured)
+        
+    Returns:
+        Tuple of (is_valid, message, tree); tree is None if parsing failed
+    """
+    # Text and raw bytes are keyed apart: the bytes may declare another encoding
+    if isinstance(source, bytes):
+        key = hashlib.blake2b(source, digest_size=16, person=b'bytes').digest()
+    else:
+        key = hashlib.blake2b(source.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    with _syntax_cache_lock:
+        cached = _syntax_cache.get(key)
+        if cached is not None:
+            _syntax_cache.move_to_end(key)
+            return cached
+    
     try:
-        ast.parse(code_string)
-        return (True, "Valid")
+        parsed = (True, "Valid", ast.parse(source))
     except SyntaxError as e:
         error_msg = f"Syntax error at line {e.lineno}"
         if e.offset:
@@ -167,9 +388,16 @@ def check_syntax(code_string: str) -> Tuple[bool, str]:
             error_msg += f"\n  {e.text.rstrip()}"
             if e.offset:
                 error_msg += f"\n  {' ' * (e.offset - 1)}^"
-        return (False, error_msg)
+        parsed = (False, error_msg, None)
     except Exception as e:
-        return (False, f"Parsing error: {str(e)}")
+        parsed = (False, f"Parsing error: {str(e)}", None)
+    
+    with _syntax_cache_lock:
+        _syntax_cache[key] = parsed
+        _syntax_cache.move_to_end(key)
+        if len(_syntax_cache) > SYNTAX_CACHE_SIZE:
+            _syntax_cache.popitem(last=False)
+    return parsed
 
 
 def _ensure_pylint_installed() -> bool:
@@ -179,37 +407,280 @@ def _ensure_pylint_installed() -> bool:
     Returns:
         True if pylint is available, False otherwise
     """
+    global _PYLINT_OK
+    if _PYLINT_OK:
+        return True
+    
+    # The tool runs under sys.executable, so a spec lookup in this
+    # interpreter answers without spawning a probe process
+    if importlib.util.find_spec("pylint") is not None:
+        _PYLINT_OK = True
+        return True
+    
+    print("Pylint not found. Attempting to install...")
     try:
         subprocess.run(
-            [sys.executable, "-m", "pylint", "--version"],
+            [sys.executable, "-m", "pip", "install", "pylint"],
             capture_output=True,
             check=True,
-            timeout=5
+            timeout=60
         )
+        importlib.invalidate_caches()
+        importlib.import_module("pylint")
+        _PYLINT_OK = True
+        print("✓ Pylint installed successfully")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        print("Pylint not found. Attempting to install...")
+    except Exception as e:
+        print(f"✗ Failed to install pylint: {e}")
+        return False
+
+
+def _pylint_error_result(message: str) -> Dict[str, Any]:
+    """Builds the run_pylint result for a run that produced no analysis."""
+    return {
+        'success': False,
+        'score': None,
+        'errors': [message],
+        'error_count': 0,
+        'warning_count': 0,
+        'convention_count': 0,
+        'refactor_count': 0,
+        'by_category': {},
+        'raw_output': ""
+    }
+
+
+def _build_pylint_result(issues: List[Dict[str, Any]], score: Optional[float], raw_output: str = "") -> Dict[str, Any]:
+    """
+    Categorizes pylint messages into the result dictionary returned by run_pylint.
+    
+    Args:
+        issues: Pylint messages (json / json2 reporter format)
+        score: Global pylint score, or None if unavailable
+        raw_output: Report text to expose as 'raw_output'
+        
+    Returns:
+        Dictionary in the run_pylint format
+    """
+    # Categorize issues in one pass; messages outside these categories
+    # (e.g. 'info') are never formatted
+    by_category = {
+        'error': [],
+        'warning': [],
+        'convention': [],
+        'refactor': [],
+        'fatal': []
+    }
+    
+    major_errors = []
+    
+    for issue in issues:
+        issue_type = issue.get('type', 'unknown').lower()
+        message = issue.get('message', '')
+        bucket = by_category.get(issue_type)
+        
+        # Collect major errors (fatal, error, and critical warnings)
+        major = issue_type == 'error' or issue_type == 'fatal' or (
+            issue_type == 'warning' and 'undefined' in message.lower())
+        if bucket is None and not major:
+            continue
+        
+        formatted = f"Line {issue.get('line', 0)}: [{issue.get('symbol', '')}] {message}"
+        if bucket is not None:
+            bucket.append(formatted)
+        if major:
+            major_errors.append(formatted)
+    
+    return {
+        'success': True,
+        'score': score,
+        'errors': major_errors,
+        'error_count': len(by_category['error']) + len(by_category['fatal']),
+        'warning_count': len(by_category['warning']),
+        'convention_count': len(by_category['convention']),
+        'refactor_count': len(by_category['refactor']),
+        'by_category': by_category,
+        'raw_output': raw_output
+    }
+
+
+def _run_pylint_legacy(abs_path: str, jobs: int, need_score: bool = True) -> Tuple[List[Dict[str, Any]], Optional[float], bytes]:
+    """
+    Runs pylint < 3: JSON messages, then the text report for the score.
+    
+    Args:
+        abs_path: Absolute path of the file to lint
+        jobs: Number of pylint worker processes (0 = auto-detect CPU cores)
+        need_score: If False, the second (text report) run is skipped
+    
+    Returns:
+        Tuple of (issues, score, undecoded text report); without need_score
+        the score is None and the JSON output stands in for the report
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "pylint", abs_path, f"--jobs={jobs}", "--output-format=json"],
+        env=_subprocess_env(),
+        capture_output=True,
+        timeout=30
+    )
+    
+    issues = []
+    try:
+        issues = json.loads(result.stdout) if result.stdout.strip() else []
+    except json.JSONDecodeError:
+        pass
+    
+    if not need_score:
+        return issues, None, result.stdout
+    
+    result_text = subprocess.run(
+        [sys.executable, "-m", "pylint", abs_path, f"--jobs={jobs}"],
+        env=_subprocess_env(),
+        capture_output=True,
+        timeout=30
+    )
+    
+    # The rating line closes the report: only scan its tail
+    score = None
+    report = result_text.stdout
+    score_match = _SCORE_RE.search(report, max(0, len(report) - 4096))
+    if score_match:
+        score = float(score_match.group(1))
+    
+    return issues, score, report
+
+
+def _pylint_has_json2() -> bool:
+    """
+    Whether the installed pylint has the json2 reporter (pylint >= 3).
+    
+    Decided once, so old pylint versions do not pay for a failed json2
+    run before every legacy run.
+    """
+    global _HAS_JSON2
+    if _HAS_JSON2 is None:
+        if PylintRun is not None:
+            _HAS_JSON2 = True
+        else:
+            try:
+                _HAS_JSON2 = int(importlib.metadata.version("pylint").split('.')[0]) >= 3
+            except Exception:
+                # Unknown (e.g. not installed yet): try json2, fall back on bad output
+                return True
+    return _HAS_JSON2
+
+
+def _can_lint_in_process(file_count: int, jobs: int) -> bool:
+    """
+    In-process runs are sequential: use them only when pylint would not
+    fan out to several worker processes anyway.
+    """
+    if PylintRun is None:
+        return False
+    if jobs == 0:
+        return file_count == 1 or (os.cpu_count() or 1) == 1
+    return jobs == 1
+
+
+def _lint_json2(abs_paths: List[str], jobs: int, timeout: float) -> Tuple[Optional[Dict[str, Any]], Union[str, bytes], Dict[str, float]]:
+    """
+    Runs pylint with the json2 reporter, in-process when possible.
+    
+    In-process runs skip the interpreter start and pylint import, and keep
+    astroid's inference cache (stdlib and third-party modules) across calls.
+    Sandbox modules are dropped from that cache first so edits are re-parsed.
+    They are not interrupted by the timeout, which only bounds subprocess runs.
+    
+    Args:
+        abs_paths: Absolute paths of the files to lint
+        jobs: Number of pylint worker processes (0 = auto-detect CPU cores)
+        timeout: Maximum execution time in seconds for the subprocess run
+        
+    Returns:
+        Tuple of (report, raw json2 output, scores by absolute path); report
+        is None when pylint did not produce json2 output (pylint < 3). The raw
+        output is left undecoded (bytes) when it comes from a subprocess.
+        
+    Raises:
+        subprocess.TimeoutExpired: If the subprocess run exceeds the timeout
+    """
+    if _can_lint_in_process(len(abs_paths), jobs):
+        buffer = io.StringIO()
         try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "pylint"],
-                capture_output=True,
-                check=True,
-                timeout=60
-            )
-            print("✓ Pylint installed successfully")
-            return True
-        except Exception as e:
-            print(f"✗ Failed to install pylint: {e}")
-            return False
+            with _IN_PROCESS_LOCK:
+                stale = [name for name, module in ASTROID_MANAGER.astroid_cache.items()
+                         if (getattr(module, 'file', None) or '').startswith(_SANDBOX_PREFIX)]
+                for name in stale:
+                    del ASTROID_MANAGER.astroid_cache[name]
+                run = PylintRun([*abs_paths, "--jobs=1"], reporter=JSON2Reporter(buffer), exit=False)
+            raw_output = buffer.getvalue()
+            report = json.loads(raw_output)
+        except Exception:
+            # Anything unexpected in-process: the subprocess run below decides
+            pass
+        else:
+            # Per-file scores from pylint's per-module counts and its own
+            # evaluation formula (the json2 reporter only scores the whole run)
+            linter = run.linter
+            modules = {}
+            for issue in report.get('messages', []):
+                modules[os.path.abspath(issue.get('absolutePath', ''))] = issue.get('module')
+            scores = {}
+            for abs_path in abs_paths:
+                counts = dict.fromkeys(('convention', 'error', 'fatal', 'info', 'refactor', 'statement', 'warning'), 0)
+                counts.update(linter.stats.by_module.get(modules.get(abs_path), {}))
+                counts['statement'] = counts['statement'] or 1
+                try:
+                    # pylint's own expression, rounded like the json2 reporter
+                    scores[abs_path] = round(float(eval(linter.config.evaluation, {}, counts)), 2)
+                except Exception:
+                    pass
+            return report, raw_output, scores
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "pylint", *abs_paths, f"--jobs={jobs}", "--output-format=json2"],
+        env=_subprocess_env(),
+        capture_output=True,
+        timeout=timeout
+    )
+    report, scores = _parse_json2_output(result.stdout, abs_paths)
+    return report, result.stdout, scores
+
+
+def _parse_json2_output(output: bytes, abs_paths: List[str]) -> Tuple[Optional[Dict[str, Any]], Dict[str, float]]:
+    """
+    Parses the raw stdout of a `pylint --output-format=json2` subprocess
+    (json.loads takes the bytes directly, no decode step).
+    
+    Returns:
+        Tuple of (report or None if the output is not json2, scores by
+        absolute path); only a single-file run has a per-file score
+    """
+    try:
+        report = json.loads(output) if output.strip() else None
+    except json.JSONDecodeError:
+        report = None
+    if not isinstance(report, dict):
+        return None, {}
+    
+    scores = {}
+    score = report.get('statistics', {}).get('score')
+    if score is not None and len(abs_paths) == 1:
+        scores[abs_paths[0]] = float(score)
+    return report, scores
 
 
-def run_pylint(path: str, return_full_report: bool = False) -> Dict[str, Any]:
+def run_pylint(path: str, return_full_report: bool = False, jobs: int = 0,
+               need_score: bool = True) -> Dict[str, Any]:
     """
     Runs pylint on a file and returns structured analysis data.
     
     Args:
         path: Path to the Python file (relative to sandbox or absolute within sandbox)
         return_full_report: If True, includes full raw output in results
+        jobs: Number of pylint worker processes (0 = auto-detect CPU cores)
+        need_score: If False, pylint < 3 skips its extra text-report run and
+                    'score' is None (pylint >= 3 scores in the same run anyway)
         
     Returns:
         Dictionary containing:
@@ -220,7 +691,7 @@ def run_pylint(path: str, return_full_report: bool = False) -> Dict[str, Any]:
             - 'convention_count': number of convention issues
             - 'refactor_count': number of refactor suggestions
             - 'by_category': dict of issues grouped by type
-            - 'raw_output': full pylint output (if return_full_report=True)
+            - 'raw_output': full pylint report, JSON on pylint >= 3 (if return_full_report=True)
             - 'success': bool indicating if pylint ran successfully
             
     Raises:
@@ -229,129 +700,173 @@ def run_pylint(path: str, return_full_report: bool = False) -> Dict[str, Any]:
     """
     # Ensure pylint is available
     if not _ensure_pylint_installed():
-        return {
-            'success': False,
-            'score': None,
-            'errors': ["Pylint is not installed and could not be installed automatically"],
-            'error_count': 0,
-            'warning_count': 0,
-            'convention_count': 0,
-            'refactor_count': 0,
-            'by_category': {},
-            'raw_output': ""
-        }
+        return _pylint_error_result("Pylint is not installed and could not be installed automatically")
     
     abs_path = validate_path(path)
     
-    if not os.path.exists(abs_path):
+    try:
+        st = os.stat(abs_path)
+    except OSError:
         raise FileNotFoundError(f"File not found: {path}")
     
-    if not os.path.isfile(abs_path):
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Path is not a file: {path}")
     
     try:
-        # Run pylint with JSON output for structured parsing
-        result = subprocess.run(
-            [sys.executable, "-m", "pylint", abs_path, "--output-format=json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        # A single pylint run: the json2 reporter (pylint >= 3) carries both
+        # the messages and the score.
+        report = None
+        if _pylint_has_json2():
+            report, raw_output, scores = _lint_json2([abs_path], jobs, timeout=30)
+        
+        if report is not None:
+            issues = report.get('messages', [])
+            score = scores.get(abs_path)
+        else:
+            # Older pylint without json2: fall back to the JSON messages
+            # plus the score scraped from the text report.
+            issues, score, raw_output = _run_pylint_legacy(abs_path, jobs, need_score)
         
-        # Also get the text report for score
-        result_text = subprocess.run(
-            [sys.executable, "-m", "pylint", abs_path],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        return _build_pylint_result(issues, score, _decode_output(raw_output) if return_full_report else "")
         
-        # Parse JSON output
-        issues = []
+    except subprocess.TimeoutExpired:
+        return _pylint_error_result("Pylint execution timed out")
+    except Exception as e:
+        return _pylint_error_result(f"Error running pylint: {str(e)}")
+
+
+def _sandbox_version() -> int:
+    """
+    Newest ctime_ns among the sandbox's Python files and directories.
+    
+    Editing a file bumps its own ctime; adding, removing or renaming one
+    bumps its directory's. __pycache__ directories are skipped.
+    """
+    newest = 0
+    stack = [SANDBOX_DIR]
+    while stack:
+        directory = stack.pop()
         try:
-            issues = json.loads(result.stdout) if result.stdout.strip() else []
-        except json.JSONDecodeError:
-            pass
+            newest = max(newest, os.stat(directory).st_ctime_ns)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '__pycache__':
+                            stack.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        newest = max(newest, entry.stat().st_ctime_ns)
+        except OSError:
+            continue
+    return newest
+
+
+def run_pylint_batch(paths: List[str], jobs: int = 0) -> Dict[str, Dict[str, Any]]:
+    """
+    Runs pylint once over several files so astroid's module cache is shared.
+    
+    Results are memoized per file on (mtime, ctime, size) and on the newest
+    change anywhere in the sandbox, since pylint's import and no-member
+    checks read the modules a file imports. Cached files are served from the
+    memo and only the stale ones are linted, in a single pylint invocation.
+    
+    Args:
+        paths: Paths to the Python files (relative to sandbox or absolute within sandbox)
+        jobs: Number of pylint worker processes (0 = auto-detect CPU cores)
         
-        # Extract score from text output
-        score = None
-        score_match = re.search(r'rated at ([-\d.]+)/10', result_text.stdout)
-        if score_match:
-            score = float(score_match.group(1))
-        
-        # Categorize issues
-        by_category = {
-            'error': [],
-            'warning': [],
-            'convention': [],
-            'refactor': [],
-            'fatal': []
-        }
+    Returns:
+        Dictionary mapping each given path to a run_pylint-style result.
+        Files are scored individually when pylint runs in-process; a
+        multi-file subprocess run (parallel jobs) only has a global score,
+        so 'score' is None there. A single path is always scored.
         
-        major_errors = []
+    Raises:
+        ValueError: If a path is outside the sandbox or is not a file
+        FileNotFoundError: If a file doesn't exist
+    """
+    sandbox_version = _sandbox_version()
+    targets = {}
+    for path in paths:
+        abs_path = validate_path(path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            raise FileNotFoundError(f"File not found: {path}")
+        if not stat.S_ISREG(st.st_mode):
+            raise ValueError(f"Path is not a file: {path}")
+        targets[path] = (abs_path, (st.st_mtime_ns, st.st_ctime_ns, st.st_size, sandbox_version))
+    
+    # A lone file gets its own score, so unscored entries left by an
+    # earlier multi-file batch are not reused for it
+    need_score = len(targets) == 1
+    
+    results = {}
+    stale = {}
+    with _pylint_cache_lock:
+        for path, (abs_path, version) in targets.items():
+            cached = _pylint_cache.get(abs_path)
+            if (cached is not None and cached[0] == version
+                    and not (need_score and cached[1]['score'] is None)):
+                _pylint_cache.move_to_end(abs_path)
+                results[path] = cached[1]
+            else:
+                stale[abs_path] = version
+    
+    if stale:
+        if not _ensure_pylint_installed():
+            failure = _pylint_error_result("Pylint is not installed and could not be installed automatically")
+            return {path: results.get(path, failure) for path in paths}
         
-        for issue in issues:
-            issue_type = issue.get('type', 'unknown').lower()
-            message = issue.get('message', '')
-            line = issue.get('line', 0)
-            symbol = issue.get('symbol', '')
-            
-            formatted = f"Line {line}: [{symbol}] {message}"
-            
-            if issue_type in by_category:
-                by_category[issue_type].append(formatted)
+        fresh = {}
+        try:
+            report = None
+            if _pylint_has_json2():
+                report, _, scores = _lint_json2(list(stale), jobs, timeout=30 * len(stale))
             
-            # Collect major errors (fatal, error, and critical warnings)
-            if issue_type in ['error', 'fatal'] or (issue_type == 'warning' and 'undefined' in message.lower()):
-                major_errors.append(formatted)
+            if report is not None:
+                buckets = {abs_path: [] for abs_path in stale}
+                for issue in report.get('messages', []):
+                    issue_path = os.path.abspath(issue.get('absolutePath') or issue.get('path', ''))
+                    if issue_path in buckets:
+                        buckets[issue_path].append(issue)
+                for abs_path, issues in buckets.items():
+                    fresh[abs_path] = _build_pylint_result(issues, scores.get(abs_path))
+            else:
+                # Older pylint without json2: lint the stale files one by one
+                for abs_path in stale:
+                    issues, score, _ = _run_pylint_legacy(abs_path, jobs)
+                    fresh[abs_path] = _build_pylint_result(issues, score)
+        except subprocess.TimeoutExpired:
+            failure = _pylint_error_result("Pylint execution timed out")
+        except Exception as e:
+            failure = _pylint_error_result(f"Error running pylint: {str(e)}")
+        else:
+            failure = None
         
-        return {
-            'success': True,
-            'score': score,
-            'errors': major_errors,
-            'error_count': len(by_category['error']) + len(by_category['fatal']),
-            'warning_count': len(by_category['warning']),
-            'convention_count': len(by_category['convention']),
-            'refactor_count': len(by_category['refactor']),
-            'by_category': by_category,
-            'raw_output': result_text.stdout if return_full_report else ""
-        }
+        with _pylint_cache_lock:
+            for abs_path, result in fresh.items():
+                _pylint_cache[abs_path] = (stale[abs_path], result)
+                _pylint_cache.move_to_end(abs_path)
+            while len(_pylint_cache) > PYLINT_CACHE_SIZE:
+                _pylint_cache.popitem(last=False)
         
-    except subprocess.TimeoutExpired:
-        return {
-            'success': False,
-            'score': None,
-            'errors': ["Pylint execution timed out"],
-            'error_count': 0,
-            'warning_count': 0,
-            'convention_count': 0,
-            'refactor_count': 0,
-            'by_category': {},
-            'raw_output': ""
-        }
-    except Exception as e:
-        return {
-            'success': False,
-            'score': None,
-            'errors': [f"Error running pylint: {str(e)}"],
-            'error_count': 0,
-            'warning_count': 0,
-            'convention_count': 0,
-            'refactor_count': 0,
-            'by_category': {},
-            'raw_output': ""
-        }
+        for path, (abs_path, _) in targets.items():
+            if path not in results:
+                results[path] = fresh.get(abs_path, failure)
+    
+    return {path: results[path] for path in paths}
 
 
-def analyze_code_quality(path: str) -> Dict[str, Any]:
+def analyze_code_quality(path: Union[str, List[str]]) -> Dict[str, Any]:
     """
     Performs comprehensive code quality analysis combining syntax check and pylint.
     
     Args:
-        path: Path to the Python file to analyze
+        path: Path to the Python file to analyze, or a list of paths to
+              analyze with a single batched pylint run
         
     Returns:
-        Dictionary with combined analysis results:
+        Dictionary with combined analysis results (for a list of paths,
+        a dictionary mapping each path to such results):
             - 'syntax_valid': bool
             - 'syntax_message': str
             - 'pylint_score': float or None
@@ -360,18 +875,82 @@ def analyze_code_quality(path: str) -> Dict[str, Any]:
             - 'all_issues': dict by category
             - 'recommendations': list of improvement suggestions
     """
-    abs_path = validate_path(path)
-    
-    # First check syntax
-    try:
-        code = read_file(path)
-        syntax_valid, syntax_msg = check_syntax(code)
-    except Exception as e:
-        syntax_valid = False
-        syntax_msg = f"Could not read file: {e}"
+    paths = [path] if isinstance(path, str) else list(path)
+    
+    # Unchanged files (same mtime, ctime and size) reuse their last report,
+    # provided no other Python file in the sandbox changed either: pylint's
+    # import and no-member checks read the modules a file imports.
+    # As in run_pylint_batch, a lone path is not served an unscored report.
+    need_score = len(paths) == 1
+    sandbox_version = _sandbox_version()
+    versions = {}
+    for file_path in paths:
+        abs_path = validate_path(file_path)
+        try:
+            st = os.stat(abs_path)
+        except OSError:
+            continue
+        versions[file_path] = (abs_path, (st.st_mtime_ns, st.st_ctime_ns, st.st_size, sandbox_version))
+    
+    reports = {}
+    with _quality_cache_lock:
+        for file_path, (abs_path, version) in versions.items():
+            cached = _quality_cache.get(abs_path)
+            if (cached is not None and cached[0] == version
+                    and not (need_score and cached[1]['syntax_valid'] and cached[1]['pylint_score'] is None)):
+                _quality_cache.move_to_end(abs_path)
+                reports[file_path] = cached[1]
+    pending = [p for p in paths if p not in reports]
+    
+    # First check syntax, parsing the raw bytes: ast honours the file's
+    # encoding declaration and the memoized tree stays available
+    syntax = {}
+    for file_path in pending:
+        try:
+            with open(validate_path(file_path), 'rb') as f:
+                source = f.read()
+        except FileNotFoundError:
+            syntax[file_path] = (False, f"Could not read file: File not found: {file_path}")
+            continue
+        except OSError as e:
+            syntax[file_path] = (False, f"Could not read file: {e}")
+            continue
+        syntax[file_path] = _parse_cached(source)[:2]
+    
+    # Run pylint analysis once over every file that parses
+    valid_paths = [p for p in pending if syntax[p][0]]
+    pylint_batch = run_pylint_batch(valid_paths) if valid_paths else {}
+    
+    with _quality_cache_lock:
+        for file_path in pending:
+            pylint_results = pylint_batch.get(file_path)
+            reports[file_path] = _quality_report(syntax[file_path][1], pylint_results)
+            # Failed pylint runs (timeouts, crashes) are retried next time
+            if file_path in versions and (pylint_results is None or pylint_results['success']):
+                abs_path, version = versions[file_path]
+                _quality_cache[abs_path] = (version, reports[file_path])
+                _quality_cache.move_to_end(abs_path)
+        while len(_quality_cache) > QUALITY_CACHE_SIZE:
+            _quality_cache.popitem(last=False)
+    
+    if isinstance(path, str):
+        return reports[path]
+    return {file_path: reports[file_path] for file_path in paths}
+
+
+def _quality_report(syntax_msg: str, pylint_results: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Builds one analyze_code_quality entry.
     
-    # If syntax is invalid, skip pylint
-    if not syntax_valid:
+    Args:
+        syntax_msg: Message returned by check_syntax
+        pylint_results: run_pylint-style results, or None if the syntax is invalid
+        
+    Returns:
+        Dictionary in the analyze_code_quality format
+    """
+    # If syntax is invalid, pylint was skipped
+    if pylint_results is None:
         return {
             'syntax_valid': False,
             'syntax_message': syntax_msg,
@@ -382,9 +961,6 @@ def analyze_code_quality(path: str) -> Dict[str, Any]:
             'recommendations': ["Fix syntax errors before proceeding with further analysis"]
         }
     
-    # Run pylint analysis
-    pylint_results = run_pylint(path)
-    
     # Generate recommendations
     recommendations = []
     if pylint_results['score'] is not None:
@@ -430,28 +1006,232 @@ def _ensure_pytest_installed() -> bool:
     Returns:
         True if pytest is available, False otherwise
     """
+    global _PYTEST_OK
+    if _PYTEST_OK:
+        return True
+    
+    # The tool runs under sys.executable, so a spec lookup in this
+    # interpreter answers without spawning a probe process
+    if importlib.util.find_spec("pytest") is not None:
+        _PYTEST_OK = True
+        return True
+    
+    print("Pytest not found. Attempting to install...")
     try:
         subprocess.run(
-            [sys.executable, "-m", "pytest", "--version"],
+            [sys.executable, "-m", "pip", "install", "pytest"],
             capture_output=True,
             check=True,
-            timeout=5
+            timeout=60
         )
+        importlib.invalidate_caches()
+        importlib.import_module("pytest")
+        _PYTEST_OK = True
+        print("✓ Pytest installed successfully")
         return True
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
-        print("Pytest not found. Attempting to install...")
-        try:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "pytest"],
-                capture_output=True,
-                check=True,
-                timeout=60
+    except Exception as e:
+        print(f"✗ Failed to install pytest: {e}")
+        return False
+
+
+def _run_streaming(cmd: List[str], timeout: float, cwd: Optional[str] = None,
+                   tail_lines: int = OUTPUT_TAIL_LINES) -> Tuple[int, str, str]:
+    """
+    Runs a command while keeping only the tail of its output in memory.
+    
+    stdout and stderr are drained line by line by two reader threads into
+    bounded deques, so a very noisy child costs O(tail_lines) memory
+    instead of its whole output.
+    
+    Args:
+        cmd: Command to execute
+        timeout: Maximum execution time in seconds
+        cwd: Working directory for the child
+        tail_lines: Number of trailing lines kept per stream
+        
+    Returns:
+        Tuple of (exit_code, stdout tail, stderr tail)
+        
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout (the child is killed)
+    """
+    proc = subprocess.Popen(
+        cmd,
+        env=_subprocess_env(),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd
+    )
+    tails = (deque(maxlen=tail_lines), deque(maxlen=tail_lines))
+    readers = [
+        threading.Thread(target=tail.extend, args=(stream,), daemon=True)
+        for tail, stream in zip(tails, (proc.stdout, proc.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+    
+    try:
+        exit_code = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+        proc.stdout.close()
+        proc.stderr.close()
+    
+    # Only the kept tail is ever decoded
+    return exit_code, _decode_output(b''.join(tails[0])), _decode_output(b''.join(tails[1]))
+
+
+def _pump_lines(stream, lines: "queue.Queue") -> None:
+    """Forwards the lines of stream to a queue, then None at end of file."""
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def _stop_pytest_worker() -> None:
+    """Kills the warm pytest worker; the next run_pytest starts a fresh one."""
+    global _pytest_worker
+    if _pytest_worker is not None:
+        proc = _pytest_worker[0]
+        proc.kill()
+        proc.wait()
+        _pytest_worker = None
+
+
+def _pytest_failure(stderr: str, summary: str, timeout: bool = False) -> Dict[str, Any]:
+    """Builds the run_pytest result for a run that produced no test results."""
+    return {
+        'success': False,
+        'exit_code': -1,
+        'passed': 0,
+        'failed': 0,
+        'errors': 1,
+        'stdout': "",
+        'stderr': stderr,
+        'timeout': timeout,
+        'summary': summary
+    }
+
+
+def _pytest_result(exit_code: int, stdout: str, stderr: str) -> Dict[str, Any]:
+    """
+    Builds the run_pytest result from a finished pytest run.
+    
+    Args:
+        exit_code: pytest exit code
+        stdout: pytest standard output (its tail at least)
+        stderr: pytest standard error
+        
+    Returns:
+        Dictionary in the run_pytest format
+    """
+    # Parse test results from the final summary line
+    # ("=== 2 failed, 3 passed, 1 error in 0.12s ===")
+    counts = {}
+    summary_line = next((line for line in reversed(stdout.splitlines()) if line.strip()), "")
+    for count, outcome in _PYTEST_SUMMARY_RE.findall(summary_line):
+        counts[outcome] = int(count)
+    passed = counts.get('passed', 0)
+    failed = counts.get('failed', 0)
+    errors = counts.get('error', 0)
+    
+    # Generate summary
+    if exit_code == 0:
+        summary = f"All tests passed ({passed} passed)"
+    elif exit_code == 1:
+        summary = f"Tests failed ({passed} passed, {failed} failed, {errors} errors)"
+    elif exit_code == 2:
+        summary = "Test execution interrupted"
+    elif exit_code == 3:
+        summary = "Internal error"
+    elif exit_code == 4:
+        summary = "Pytest command line usage error"
+    elif exit_code == 5:
+        summary = "No tests collected"
+    else:
+        summary = f"Unknown exit code: {exit_code}"
+    
+    return {
+        'success': exit_code == 0,
+        'exit_code': exit_code,
+        'passed': passed,
+        'failed': failed,
+        'errors': errors,
+        'stdout': stdout,
+        'stderr': stderr,
+        'timeout': False,
+        'summary': summary
+    }
+
+
+def _run_pytest_in_worker(args: List[str], timeout: float) -> Tuple[int, str, str]:
+    """
+    Runs pytest in the warm worker interpreter (see src/utils/pytest_worker.py).
+    
+    The worker keeps pytest imported between runs and forgets the sandbox
+    modules before each one, so edited code is always re-imported.
+    
+    Args:
+        args: pytest command-line arguments
+        timeout: Maximum execution time in seconds
+        
+    Returns:
+        Tuple of (exit_code, stdout tail, stderr tail)
+        
+    Raises:
+        subprocess.TimeoutExpired: If the run exceeds the timeout (the worker is killed)
+        RuntimeError: If the worker could not serve the request
+    """
+    global _pytest_worker
+    with _pytest_worker_lock:
+        if _pytest_worker is None or _pytest_worker[0].poll() is not None:
+            proc = subprocess.Popen(
+                [sys.executable, "-u", PYTEST_WORKER_SCRIPT],
+                env=_subprocess_env(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                # Run output is captured inside the worker (fds included);
+                # anything outside a run, such as a crash, shows on our stderr
+                stderr=None,
+                text=True,
+                encoding='utf-8',
+                # Outside the sandbox, which restore_sandbox replaces wholesale
+                cwd=os.path.dirname(SANDBOX_DIR)
             )
-            print("✓ Pytest installed successfully")
-            return True
-        except Exception as e:
-            print(f"✗ Failed to install pytest: {e}")
-            return False
+            responses = queue.Queue()
+            threading.Thread(target=_pump_lines, args=(proc.stdout, responses), daemon=True).start()
+            _pytest_worker = (proc, responses)
+        proc, responses = _pytest_worker
+        
+        request = {
+            'args': args,
+            'cwd': SANDBOX_DIR,
+            'purge': SANDBOX_DIR,
+            'tail_lines': OUTPUT_TAIL_LINES
+        }
+        try:
+            proc.stdin.write(json.dumps(request) + "\n")
+            proc.stdin.flush()
+            line = responses.get(timeout=timeout)
+        except queue.Empty:
+            _stop_pytest_worker()
+            raise subprocess.TimeoutExpired(args, timeout)
+        except OSError as e:
+            _stop_pytest_worker()
+            raise RuntimeError(f"pytest worker unavailable: {e}")
+        
+        if line is None:
+            _stop_pytest_worker()
+            raise RuntimeError("pytest worker exited")
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error'])
+        return response['exit_code'], response['stdout'], response['stderr']
 
 
 def run_pytest(test_file_path: str, verbose: bool = True, timeout: int = 30) -> Dict[str, Any]:
@@ -470,8 +1250,8 @@ def run_pytest(test_file_path: str, verbose: bool = True, timeout: int = 30) ->
             - 'passed': number of tests passed
             - 'failed': number of tests failed
             - 'errors': number of tests with errors
-            - 'stdout': standard output from pytest
-            - 'stderr': standard error from pytest
+            - 'stdout': standard output from pytest (last OUTPUT_TAIL_LINES lines)
+            - 'stderr': standard error from pytest (last OUTPUT_TAIL_LINES lines)
             - 'timeout': bool indicating if execution timed out
             - 'summary': brief summary message
             
@@ -481,25 +1261,9 @@ def run_pytest(test_file_path: str, verbose: bool = True, timeout: int = 30) ->
     """
     # Ensure pytest is available
     if not _ensure_pytest_installed():
-        return {
-            'success': False,
-            'exit_code': -1,
-            'passed': 0,
-            'failed': 0,
-            'errors': 1,
-            'stdout': "",
-            'stderr': "Pytest is not installed and could not be installed automatically",
-            'timeout': False,
-            'summary': "Pytest unavailable"
-        }
-    
-    abs_path = validate_path(test_file_path)
+        return _pytest_failure("Pytest is not installed and could not be installed automatically", "Pytest unavailable")
     
-    if not os.path.exists(abs_path):
-        raise FileNotFoundError(f"Test file not found: {test_file_path}")
-    
-    if not os.path.isfile(abs_path):
-        raise ValueError(f"Path is not a file: {test_file_path}")
+    abs_path = _require_file(test_file_path, "Test file not found")
     
     # Build pytest command
     cmd = [sys.executable, "-m", "pytest", abs_path]
@@ -508,75 +1272,54 @@ def run_pytest(test_file_path: str, verbose: bool = True, timeout: int = 30) ->
     cmd.extend(["--tb=short", "--no-header"])
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=SANDBOX_DIR
-        )
-        
-        stdout = result.stdout
-        stderr = result.stderr
-        exit_code = result.returncode
-        
-        # Parse test results from output
-        passed = len(re.findall(r'PASSED', stdout))
-        failed = len(re.findall(r'FAILED', stdout))
-        errors = len(re.findall(r'ERROR', stdout))
-        
-        # Generate summary
-        if exit_code == 0:
-            summary = f"All tests passed ({passed} passed)"
-        elif exit_code == 1:
-            summary = f"Tests failed ({passed} passed, {failed} failed, {errors} errors)"
-        elif exit_code == 2:
-            summary = "Test execution interrupted"
-        elif exit_code == 3:
-            summary = "Internal error"
-        elif exit_code == 4:
-            summary = "Pytest command line usage error"
-        elif exit_code == 5:
-            summary = "No tests collected"
-        else:
-            summary = f"Unknown exit code: {exit_code}"
+        try:
+            exit_code, stdout, stderr = _run_pytest_in_worker(cmd[3:], timeout)
+        except RuntimeError:
+            # Worker crashed (e.g. a test called os._exit): use a fresh interpreter
+            exit_code, stdout, stderr = _run_streaming(cmd, timeout, cwd=SANDBOX_DIR)
         
-        return {
-            'success': exit_code == 0,
-            'exit_code': exit_code,
-            'passed': passed,
-            'failed': failed,
-            'errors': errors,
-            'stdout': stdout,
-            'stderr': stderr,
-            'timeout': False,
-            'summary': summary
-        }
+        return _pytest_result(exit_code, stdout, stderr)
         
     except subprocess.TimeoutExpired:
-        return {
-            'success': False,
-            'exit_code': -1,
-            'passed': 0,
-            'failed': 0,
-            'errors': 1,
-            'stdout': "",
-            'stderr': f"Test execution timed out after {timeout} seconds",
-            'timeout': True,
-            'summary': f"Timeout after {timeout}s"
-        }
+        return _pytest_failure(f"Test execution timed out after {timeout} seconds", f"Timeout after {timeout}s", timeout=True)
     except Exception as e:
-        return {
-            'success': False,
-            'exit_code': -1,
-            'passed': 0,
-            'failed': 0,
-            'errors': 1,
-            'stdout': "",
-            'stderr': f"Error running pytest: {str(e)}",
-            'timeout': False,
-            'summary': f"Execution error: {str(e)}"
-        }
+        return _pytest_failure(f"Error running pytest: {str(e)}", f"Execution error: {str(e)}")
+
+
+def _script_result(exit_code: int, stdout: str, stderr: str, execution_time: float) -> Dict[str, Any]:
+    """Builds the run_script result for a script that ran to completion."""
+    # Generate summary
+    if exit_code == 0:
+        summary = f"Success ({execution_time:.2f}s)"
+    else:
+        summary = f"Exit code {exit_code} ({execution_time:.2f}s)"
+    
+    return {
+        'success': exit_code == 0,
+        'exit_code': exit_code,
+        'stdout': stdout,
+        'stderr': stderr,
+        'timeout': False,
+        'execution_time': execution_time,
+        'summary': summary
+    }
+
+
+def _script_timeout_result(stdout: Optional[bytes], stderr: Optional[bytes],
+                           timeout: float, execution_time: float) -> Dict[str, Any]:
+    """Builds the run_script result for a script killed by its timeout, keeping partial output."""
+    stdout = stdout.decode('utf-8') if stdout else ""
+    stderr = stderr.decode('utf-8') if stderr else ""
+    
+    return {
+        'success': False,
+        'exit_code': -1,
+        'stdout': stdout,
+        'stderr': stderr + f"\n[TIMEOUT] Script exceeded {timeout}s limit - possible infinite loop",
+        'timeout': True,
+        'execution_time': execution_time,
+        'summary': f"Timeout after {timeout}s (infinite loop?)"
+    }
 
 
 def run_script(script_path: str, timeout: int = 5, args: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -605,13 +1348,7 @@ def run_script(script_path: str, timeout: int = 5, args: Optional[List[str]] = N
         ValueError: If the path is outside the sandbox
         FileNotFoundError: If the script doesn't exist
     """
-    abs_path = validate_path(script_path)
-    
-    if not os.path.exists(abs_path):
-        raise FileNotFoundError(f"Script not found: {script_path}")
-    
-    if not os.path.isfile(abs_path):
-        raise ValueError(f"Path is not a file: {script_path}")
+    abs_path = _require_file(script_path, "Script not found")
     
     # Build command
     cmd = [sys.executable, abs_path]
@@ -624,6 +1361,7 @@ def run_script(script_path: str, timeout: int = 5, args: Optional[List[str]] = N
     try:
         result = subprocess.run(
             cmd,
+            env=_subprocess_env(),
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -631,40 +1369,13 @@ def run_script(script_path: str, timeout: int = 5, args: Optional[List[str]] = N
         )
         
         execution_time = time.time() - start_time
-        exit_code = result.returncode
-        
-        # Generate summary
-        if exit_code == 0:
-            summary = f"Success ({execution_time:.2f}s)"
-        else:
-            summary = f"Exit code {exit_code} ({execution_time:.2f}s)"
-        
-        return {
-            'success': exit_code == 0,
-            'exit_code': exit_code,
-            'stdout': result.stdout,
-            'stderr': result.stderr,
-            'timeout': False,
-            'execution_time': execution_time,
-            'summary': summary
-        }
+        return _script_result(result.returncode, result.stdout, result.stderr, execution_time)
         
     except subprocess.TimeoutExpired as e:
         execution_time = time.time() - start_time
         
         # Try to get partial output
-        stdout = e.stdout.decode('utf-8') if e.stdout else ""
-        stderr = e.stderr.decode('utf-8') if e.stderr else ""
-        
-        return {
-            'success': False,
-            'exit_code': -1,
-            'stdout': stdout,
-            'stderr': stderr + f"\n[TIMEOUT] Script exceeded {timeout}s limit - possible infinite loop",
-            'timeout': True,
-            'execution_time': execution_time,
-            'summary': f"Timeout after {timeout}s (infinite loop?)"
-        }
+        return _script_timeout_result(e.stdout, e.stderr, timeout, execution_time)
     except Exception as e:
         execution_time = time.time() - start_time
         return {
@@ -704,88 +1415,546 @@ def run_and_analyze(script_path: str, test_path: Optional[str] = None) -> Dict[s
         'recommendations': []
     }
     
-    # 1. Run the script
+    # The three steps are independent subprocess pipelines: run them side by
+    # side. An unparsable script needs no pylint run, so its quality report
+    # is built inline instead of taking a worker.
     try:
-        script_result = run_script(script_path)
-        results['script_execution'] = script_result
-        
-        if script_result['timeout']:
-            results['overall_status'] = 'timeout'
-            results['issues_found'].append("Script has infinite loop or hangs")
-            results['recommendations'].append("Fix infinite loop or add proper exit conditions")
-        elif not script_result['success']:
-            results['overall_status'] = 'fail'
-            results['issues_found'].append(f"Script failed: {script_result['stderr']}")
-    except Exception as e:
-        results['issues_found'].append(f"Cannot execute script: {e}")
-        results['overall_status'] = 'fail'
+        syntax_valid = check_syntax(read_file(script_path))[0]
+    except Exception:
+        syntax_valid = False
     
-    # 2. Analyze code quality
-    try:
-        quality = analyze_code_quality(script_path)
-        results['code_quality'] = quality
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        script_future = executor.submit(run_script, script_path)
+        quality_future = executor.submit(analyze_code_quality, script_path) if syntax_valid else None
+        test_future = executor.submit(run_pytest, test_path) if test_path else None
         
-        if not quality['syntax_valid']:
+        # 1. Run the script
+        try:
+            script_result = script_future.result()
+            results['script_execution'] = script_result
+            
+            if script_result['timeout']:
+                results['overall_status'] = 'timeout'
+                results['issues_found'].append("Script has infinite loop or hangs")
+                results['recommendations'].append("Fix infinite loop or add proper exit conditions")
+            elif not script_result['success']:
+                results['overall_status'] = 'fail'
+                results['issues_found'].append(f"Script failed: {script_result['stderr']}")
+        except Exception as e:
+            results['issues_found'].append(f"Cannot execute script: {e}")
             results['overall_status'] = 'fail'
-            results['issues_found'].append(f"Syntax error: {quality['syntax_message']}")
-        
-        if quality['critical_issues']:
-            results['issues_found'].extend(quality['critical_issues'])
         
-        results['recommendations'].extend(quality['recommendations'])
-    except Exception as e:
-        results['issues_found'].append(f"Cannot analyze quality: {e}")
-    
-    # 3. Run tests if provided
-    if test_path:
+        # 2. Analyze code quality
         try:
-            test_result = run_pytest(test_path)
-            results['tests'] = test_result
+            quality = quality_future.result() if quality_future else analyze_code_quality(script_path)
+            results['code_quality'] = quality
             
-            if not test_result['success']:
+            if not quality['syntax_valid']:
                 results['overall_status'] = 'fail'
-                results['issues_found'].append(f"Tests failed: {test_result['summary']}")
+                results['issues_found'].append(f"Syntax error: {quality['syntax_message']}")
+            
+            if quality['critical_issues']:
+                results['issues_found'].extend(quality['critical_issues'])
+            
+            results['recommendations'].extend(quality['recommendations'])
         except Exception as e:
-            results['issues_found'].append(f"Cannot run tests: {e}")
+            results['issues_found'].append(f"Cannot analyze quality: {e}")
+        
+        # 3. Run tests if provided
+        if test_future:
+            try:
+                test_result = test_future.result()
+                results['tests'] = test_result
+                
+                if not test_result['success']:
+                    results['overall_status'] = 'fail'
+                    results['issues_found'].append(f"Tests failed: {test_result['summary']}")
+            except Exception as e:
+                results['issues_found'].append(f"Cannot run tests: {e}")
     
     return results
 
 
+# ============================================================================
+# Async variants: fan out many subprocesses from one event loop
+# ============================================================================
+
+async def _run_async(cmd: List[str], timeout: float, cwd: Optional[str] = None) -> Tuple[int, bytes, bytes]:
+    """
+    Runs a command with asyncio.create_subprocess_exec.
+    
+    Returns:
+        Tuple of (exit_code, stdout, stderr), undecoded
+        
+    Raises:
+        subprocess.TimeoutExpired: If the command exceeds the timeout (the child is killed)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        env=_subprocess_env()
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return proc.returncode, stdout, stderr
+
+
+async def run_pylint_async(path: str, return_full_report: bool = False, jobs: int = 0) -> Dict[str, Any]:
+    """
+    Async variant of run_pylint: one pylint subprocess that does not block
+    a thread, so `asyncio.gather` can lint many files at once.
+    
+    Always runs in a subprocess (in-process runs are serialized); pylint < 3
+    falls back to run_pylint in a worker thread.
+    
+    Args:
+        path: Path to the Python file (relative to sandbox or absolute within sandbox)
+        return_full_report: If True, includes full raw output in results
+        jobs: Number of pylint worker processes (0 = auto-detect CPU cores)
+        
+    Returns:
+        Same dictionary as run_pylint()
+        
+    Raises:
+        ValueError: If the path is outside the sandbox
+        FileNotFoundError: If the file doesn't exist
+    """
+    if not _ensure_pylint_installed():
+        return _pylint_error_result("Pylint is not installed and could not be installed automatically")
+    
+    abs_path = _require_file(path, "File not found")
+    if not _pylint_has_json2():
+        return await asyncio.to_thread(run_pylint, path, return_full_report, jobs)
+    
+    try:
+        _, stdout, _ = await _run_async(
+            [sys.executable, "-m", "pylint", abs_path, f"--jobs={jobs}", "--output-format=json2"],
+            timeout=30
+        )
+    except subprocess.TimeoutExpired:
+        return _pylint_error_result("Pylint execution timed out")
+    except Exception as e:
+        return _pylint_error_result(f"Error running pylint: {str(e)}")
+    
+    report, scores = _parse_json2_output(stdout, [abs_path])
+    if report is None:
+        return await asyncio.to_thread(run_pylint, path, return_full_report, jobs)
+    return _build_pylint_result(report.get('messages', []), scores.get(abs_path),
+                                _decode_output(stdout) if return_full_report else "")
+
+
+async def run_pytest_async(test_file_path: str, verbose: bool = True, timeout: int = 30) -> Dict[str, Any]:
+    """
+    Async variant of run_pytest, in a fresh pytest subprocess per call
+    (the warm worker serves one run at a time).
+    
+    Args:
+        test_file_path: Path to the test file (relative to sandbox or absolute within sandbox)
+        verbose: If True, runs pytest in verbose mode
+        timeout: Maximum execution time in seconds (default: 30)
+        
+    Returns:
+        Same dictionary as run_pytest()
+        
+    Raises:
+        ValueError: If the path is outside the sandbox
+        FileNotFoundError: If the test file doesn't exist
+    """
+    if not _ensure_pytest_installed():
+        return _pytest_failure("Pytest is not installed and could not be installed automatically",
+                               "Pytest unavailable")
+    
+    abs_path = _require_file(test_file_path, "Test file not found")
+    
+    cmd = [sys.executable, "-m", "pytest", abs_path]
+    if verbose:
+        cmd.append("-v")
+    cmd.extend(["--tb=short", "--no-header"])
+    
+    try:
+        exit_code, stdout, stderr = await _run_async(cmd, timeout, cwd=SANDBOX_DIR)
+    except subprocess.TimeoutExpired:
+        return _pytest_failure(f"Test execution timed out after {timeout} seconds",
+                               f"Timeout after {timeout}s", timeout=True)
+    except Exception as e:
+        return _pytest_failure(f"Error running pytest: {str(e)}", f"Execution error: {str(e)}")
+    
+    # Same bounded output as run_pytest
+    stdout = _decode_output(b''.join(stdout.splitlines(keepends=True)[-OUTPUT_TAIL_LINES:]))
+    stderr = _decode_output(b''.join(stderr.splitlines(keepends=True)[-OUTPUT_TAIL_LINES:]))
+    return _pytest_result(exit_code, stdout, stderr)
+
+
+async def run_script_async(script_path: str, timeout: int = 5, args: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Async variant of run_script.
+    
+    Args:
+        script_path: Path to the Python script (relative to sandbox or absolute within sandbox)
+        timeout: Maximum execution time in seconds (default: 5 for quick feedback)
+        args: Optional list of command-line arguments to pass to the script
+        
+    Returns:
+        Same dictionary as run_script() (no partial output on timeout)
+        
+    Raises:
+        ValueError: If the path is outside the sandbox
+        FileNotFoundError: If the script doesn't exist
+    """
+    abs_path = _require_file(script_path, "Script not found")
+    
+    cmd = [sys.executable, abs_path]
+    if args:
+        cmd.extend(args)
+    
+    start_time = time.time()
+    try:
+        exit_code, stdout, stderr = await _run_async(cmd, timeout, cwd=SANDBOX_DIR)
+    except subprocess.TimeoutExpired:
+        return _script_timeout_result(None, None, timeout, time.time() - start_time)
+    except Exception as e:
+        return {
+            'success': False,
+            'exit_code': -1,
+            'stdout': "",
+            'stderr': f"Error executing script: {str(e)}",
+            'timeout': False,
+            'execution_time': time.time() - start_time,
+            'summary': f"Execution error: {str(e)}"
+        }
+    return _script_result(exit_code, _decode_output(stdout), _decode_output(stderr), time.time() - start_time)
+
+
 # ============================================================================
 # INCREMENT 4: THE POLISHER - Quality & Formatter
 # ============================================================================
 
-def _ensure_black_installed() -> bool:
+def _ensure_black_installed(force: bool = False) -> bool:
     """
     Checks if black is installed, attempts to install if not.
     
+    Black is imported into this process when possible (see _BLACK_MOD),
+    so formatting does not need a new interpreter per call. The outcome is
+    remembered in _BLACK_STATE, so later calls neither re-probe nor retry
+    a failed installation.
+    
+    Args:
+        force: Check again even if an earlier call settled the question
+    
     Returns:
         True if black is available, False otherwise
     """
+    global _BLACK_MOD, _BLACK_STATE
+    if _BLACK_STATE is not None and not force:
+        return _BLACK_STATE
+    try:
+        _BLACK_MOD = importlib.import_module("black")
+        _BLACK_STATE = True
+        return True
+    except ImportError:
+        pass
+    
     try:
+        # Only the exit status matters: no pipes to set up and drain
         subprocess.run(
             [sys.executable, "-m", "black", "--version"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=True,
             timeout=5
         )
+        _BLACK_STATE = True
         return True
     except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
         print("Black not found. Attempting to install...")
         try:
             subprocess.run(
                 [sys.executable, "-m", "pip", "install", "black"],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
                 timeout=60
             )
+            importlib.invalidate_caches()
+            try:
+                _BLACK_MOD = importlib.import_module("black")
+            except ImportError:
+                pass
             print("✓ Black installed successfully")
+            _BLACK_STATE = True
             return True
         except Exception as e:
             print(f"✗ Failed to install black: {e}")
+            _BLACK_STATE = False
             return False
 
 
+def _decode_source(src: bytes) -> Tuple[str, str, str]:
+    """
+    Decodes a Python file the way Black does.
+    
+    Returns:
+        Tuple of (text with LF newlines, encoding, newline to write back)
+    """
+    buf = io.BytesIO(src)
+    encoding, lines = tokenize.detect_encoding(buf.readline)
+    if not lines:
+        return "", encoding, "\n"
+    newline = "\r\n" if lines[0][-2:] == b"\r\n" else "\n"
+    buf.seek(0)
+    with io.TextIOWrapper(buf, encoding) as text:
+        return text.read(), encoding, newline
+
+
+def _black_in_process(abs_path: str, src: bytes, key: Tuple[bytes, int],
+                      line_length: int, check_only: bool) -> Dict[str, Any]:
+    """Formats a file with the black module imported in this process."""
+    try:
+        text, encoding, newline = _decode_source(src)
+        formatted = _BLACK_MOD.format_file_contents(
+            text, fast=True, mode=_BLACK_MOD.Mode(line_length=line_length)
+        )
+    except _BLACK_MOD.NothingChanged:
+        _remember_format(key, src, False)
+        return _black_format_result(abs_path, src, False, check_only)
+    except Exception as e:
+        summary = "Error checking format" if check_only else "Formatting failed"
+        return _black_failure(f"error: cannot format {abs_path}: {e}", summary)
+    
+    if newline != "\n":
+        formatted = formatted.replace("\n", newline)
+    formatted = formatted.encode(encoding)
+    _remember_format(key, formatted, True)
+    return _black_format_result(abs_path, formatted, True, check_only)
+
+
+def _black_format_result(abs_path: str, formatted: bytes, reformatted: bool, check_only: bool) -> Dict[str, Any]:
+    """
+    Builds the apply_black_formatting result for a known Black output,
+    writing the formatted source back unless check_only is set.
+    """
+    if not reformatted:
+        return {
+            'success': True,
+            'reformatted': False,
+            'stdout': "",
+            'stderr': "",
+            'summary': "File already formatted"
+        }
+    if check_only:
+        return {
+            'success': True,
+            'reformatted': True,
+            'stdout': "",
+            'stderr': f"would reformat {abs_path}",
+            'summary': "File would be reformatted"
+        }
+    with open(abs_path, 'wb') as f:
+        f.write(formatted)
+    _invalidate_read_cache(abs_path)
+    return {
+        'success': True,
+        'reformatted': True,
+        'stdout': "",
+        'stderr': f"reformatted {abs_path}",
+        'summary': "File reformatted successfully"
+    }
+
+
+def _remember_format(key: Tuple[bytes, int], formatted: bytes, reformatted: bool) -> None:
+    """Stores a Black output in the format memo."""
+    with _format_cache_lock:
+        _format_cache[key] = (formatted, reformatted)
+        _format_cache.move_to_end(key)
+        if len(_format_cache) > FORMAT_CACHE_SIZE:
+            _format_cache.popitem(last=False)
+
+
+def _black_failure(stderr: str, summary: str) -> Dict[str, Any]:
+    """Builds the apply_black_formatting result for a failed Black run."""
+    return {
+        'success': False,
+        'reformatted': False,
+        'stdout': "",
+        'stderr': stderr,
+        'summary': summary
+    }
+
+
+def _black_via_cli(pending: Dict[str, Tuple[bytes, Tuple[bytes, int]]],
+                   line_length: int, check_only: bool) -> Dict[str, Dict[str, Any]]:
+    """
+    Formats files with `python -m black` subprocesses, BLACK_BATCH_SIZE
+    files per invocation.
+    
+    Args:
+        pending: abs_path -> (source bytes, format memo key)
+        line_length: Maximum line length
+        check_only: If True, pass --check and leave the files untouched
+        
+    Returns:
+        Dictionary mapping each abs_path to an apply_black_formatting result
+    """
+    results = {}
+    abs_paths = list(pending)
+    for start in range(0, len(abs_paths), BLACK_BATCH_SIZE):
+        chunk = abs_paths[start:start + BLACK_BATCH_SIZE]
+        
+        # Build black command
+        cmd = [sys.executable, "-m", "black", *chunk, f"--line-length={line_length}"]
+        if check_only:
+            cmd.append("--check")
+        
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=30 * len(chunk)
+            )
+        except subprocess.TimeoutExpired:
+            failure = _black_failure("Black formatting timed out", "Timeout")
+            results.update((abs_path, failure) for abs_path in chunk)
+            continue
+        except Exception as e:
+            failure = _black_failure(f"Error running black: {str(e)}", f"Error: {str(e)}")
+            results.update((abs_path, failure) for abs_path in chunk)
+            continue
+        
+        # Black reports per file on stderr: "reformatted <path>",
+        # "would reformat <path>" (--check) or an "error: ..." line naming the
+        # path, possibly followed by context lines; unchanged files are not mentioned
+        reports = {}
+        errors = set()
+        current = None
+        for line in result.stderr.splitlines():
+            if line.startswith("reformatted "):
+                current = line[len("reformatted "):]
+            elif line.startswith("would reformat "):
+                current = line[len("would reformat "):]
+            elif line.startswith("error: "):
+                named = [abs_path for abs_path in chunk if abs_path in line]
+                current = max(named, key=len) if named else None
+                if current is not None:
+                    errors.add(current)
+            elif current in errors and line.strip():
+                reports[current] += "\n" + line
+                continue
+            else:
+                current = None
+                continue
+            if current is not None:
+                reports[current] = line
+        
+        # Exit code 0 = files were already formatted or successfully reformatted
+        # Exit code 1 = some file would be reformatted (when using --check)
+        # Exit code 123 = some file could not be formatted (listed in errors)
+        # Other codes = errors
+        for abs_path in chunk:
+            src, key = pending[abs_path]
+            stderr = reports.get(abs_path, "")
+            if abs_path in errors or result.returncode not in (0, 1, 123):
+                summary = "Error checking format" if check_only else "Formatting failed"
+                results[abs_path] = _black_failure(stderr or result.stderr, summary)
+                continue
+            
+            if check_only:
+                reformatted = abs_path in reports
+                if not reformatted:
+                    _remember_format(key, src, False)
+                summary = "File would be reformatted" if reformatted else "File already formatted"
+            else:
+                with open(abs_path, 'rb') as f:
+                    formatted = f.read()
+                reformatted = formatted != src
+                _remember_format(key, formatted, reformatted)
+                if reformatted:
+                    _invalidate_read_cache(abs_path)
+                summary = "File reformatted successfully" if reformatted else "File already formatted"
+            
+            results[abs_path] = {
+                'success': True,
+                'reformatted': reformatted,
+                'stdout': "",
+                'stderr': stderr,
+                'summary': summary
+            }
+    return results
+
+
+def apply_black_formatting_batch(paths: List[str], line_length: int = 88,
+                                  check_only: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Applies Black code formatting to several Python files at once.
+    
+    Sources Black already formatted are served from the format memo. The
+    others are formatted in-process when black is importable here; failing
+    that they go to as few `python -m black` invocations as possible
+    (BLACK_BATCH_SIZE files each), so Black's startup is paid once per batch
+    instead of per file.
+    
+    Args:
+        paths: Paths to the Python files (relative to sandbox or absolute within sandbox)
+        line_length: Maximum line length (default: 88, Black's default)
+        check_only: If True, only check which files would be reformatted
+        
+    Returns:
+        Dictionary mapping each given path to an apply_black_formatting result
+        
+    Raises:
+        ValueError: If a path is outside the sandbox or is not a file
+        FileNotFoundError: If a file doesn't exist
+    """
+    targets = {}
+    pending = {}
+    results = {}
+    for path in paths:
+        abs_path = _require_file(path, "File not found")
+        targets[path] = abs_path
+        if abs_path in pending or abs_path in results:
+            continue
+        with open(abs_path, 'rb') as f:
+            src = f.read()
+        
+        # Repair loops re-format unchanged sources: reuse Black's earlier output
+        key = (hashlib.blake2b(src, digest_size=16).digest(), line_length)
+        with _format_cache_lock:
+            cached = _format_cache.get(key)
+            if cached is not None:
+                _format_cache.move_to_end(key)
+        if cached is not None:
+            results[abs_path] = _black_format_result(abs_path, cached[0], cached[1], check_only)
+        else:
+            pending[abs_path] = (src, key)
+    
+    if pending:
+        # Ensure black is available
+        if not _ensure_black_installed():
+            failure = _black_failure(
+                "Black is not installed and could not be installed automatically",
+                "Black unavailable"
+            )
+            results.update((abs_path, failure) for abs_path in pending)
+            pending = {}
+        
+        # Black imported here needs no process at all
+        if _BLACK_MOD is not None:
+            for abs_path, (src, key) in pending.items():
+                results[abs_path] = _black_in_process(abs_path, src, key, line_length, check_only)
+            pending = {}
+        
+        if pending:
+            results.update(_black_via_cli(pending, line_length, check_only))
+    
+    return {path: results[abs_path] for path, abs_path in targets.items()}
+
+
 def apply_black_formatting(path: str, line_length: int = 88, check_only: bool = False) -> Dict[str, Any]:
     """
     Applies Black code formatting to a Python file.
@@ -816,86 +1985,18 @@ def apply_black_formatting(path: str, line_length: int = 88, check_only: bool =
         ValueError: If the path is outside the sandbox
         FileNotFoundError: If the file doesn't exist
     """
-    # Ensure black is available
-    if not _ensure_black_installed():
-        return {
-            'success': False,
-            'reformatted': False,
-            'stdout': "",
-            'stderr': "Black is not installed and could not be installed automatically",
-            'summary': "Black unavailable"
-        }
-    
-    abs_path = validate_path(path)
-    
-    if not os.path.exists(abs_path):
-        raise FileNotFoundError(f"File not found: {path}")
-    
-    if not os.path.isfile(abs_path):
-        raise ValueError(f"Path is not a file: {path}")
-    
-    # Build black command
-    cmd = [sys.executable, "-m", "black", abs_path, f"--line-length={line_length}"]
-    if check_only:
-        cmd.append("--check")
-    
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        stdout = result.stdout
-        stderr = result.stderr
-        exit_code = result.returncode
-        
-        # Exit code 0 = file was already formatted or successfully reformatted
-        # Exit code 1 = file would be reformatted (when using --check)
-        # Other codes = errors
-        
-        if check_only:
-            reformatted = exit_code == 1
-            success = exit_code in [0, 1]
-            if exit_code == 0:
-                summary = "File already formatted"
-            elif exit_code == 1:
-                summary = "File would be reformatted"
-            else:
-                summary = "Error checking format"
-        else:
-            reformatted = "reformatted" in stdout.lower()
-            success = exit_code == 0
-            if reformatted:
-                summary = "File reformatted successfully"
-            else:
-                summary = "File already formatted" if success else "Formatting failed"
-        
-        return {
-            'success': success,
-            'reformatted': reformatted,
-            'stdout': stdout,
-            'stderr': stderr,
-            'summary': summary
-        }
-        
-    except subprocess.TimeoutExpired:
-        return {
-            'success': False,
-            'reformatted': False,
-            'stdout': "",
-            'stderr': "Black formatting timed out",
-            'summary': "Timeout"
-        }
-    except Exception as e:
-        return {
-            'success': False,
-            'reformatted': False,
-            'stdout': "",
-            'stderr': f"Error running black: {str(e)}",
-            'summary': f"Error: {str(e)}"
-        }
+    return apply_black_formatting_batch([path], line_length, check_only)[path]
+
+
+def _dir_versions_current(dir_versions: Tuple[Tuple[str, int], ...]) -> bool:
+    """True if every directory still has the recorded mtime."""
+    for directory, mtime_ns in dir_versions:
+        try:
+            if os.stat(directory).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
 
 
 def get_project_structure(base_path: str = "", max_depth: int = 5, show_hidden: bool = False) -> str:
@@ -927,68 +2028,77 @@ def get_project_structure(base_path: str = "", max_depth: int = 5, show_hidden:
     if not os.path.isdir(abs_path):
         raise ValueError(f"Path is not a directory: {base_path}")
     
-    def _build_tree(directory: str, prefix: str = "", depth: int = 0) -> List[str]:
+    # The tree only shows names, which change only when a listed directory's
+    # mtime does: re-stat those directories instead of walking them again
+    key = (abs_path, max_depth, show_hidden)
+    with _tree_cache_lock:
+        cached = _tree_cache.get(key)
+        if cached is not None:
+            _tree_cache.move_to_end(key)
+    if cached is not None and _dir_versions_current(cached[0]):
+        return cached[1]
+    
+    dir_versions = []
+    
+    # Header first; _build_tree appends every line to this one list
+    tree_lines = [f"📦 {os.path.basename(abs_path) or 'sandbox'}/"]
+    append = tree_lines.append
+    
+    def _build_tree(directory: str, prefix: str = "", depth: int = 0) -> None:
         """Recursively build tree structure."""
         if depth > max_depth:
-            return []
+            return
         
-        lines = []
         try:
-            entries = sorted(os.listdir(directory))
+            # Stat before listing, so a change made meanwhile invalidates the cache
+            dir_versions.append((directory, os.stat(directory).st_mtime_ns))
+            # DirEntry caches the file type, so no extra stat per entry
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
             
             # Filter hidden files if needed
             if not show_hidden:
-                entries = [e for e in entries if not e.startswith('.')]
+                entries = [e for e in entries if not e.name.startswith('.')]
             
             # Separate directories and files
-            dirs = [e for e in entries if os.path.isdir(os.path.join(directory, e))]
-            files = [e for e in entries if os.path.isfile(os.path.join(directory, e))]
+            dirs = [e for e in entries if e.is_dir()]
+            files = [e for e in entries if e.is_file()]
             
             # Combine: directories first, then files
             all_entries = dirs + files
+            last = len(all_entries) - 1
+            
+            # The tree characters for this level, built once per directory
+            branch, last_branch = prefix + "├── ", prefix + "└── "
+            child_prefix, last_child_prefix = prefix + "│   ", prefix + "    "
             
             for i, entry in enumerate(all_entries):
-                is_last = i == len(all_entries) - 1
-                entry_path = os.path.join(directory, entry)
-                
-                # Choose the right tree characters
-                if is_last:
-                    current = "└── "
-                    extension = "    "
-                else:
-                    current = "├── "
-                    extension = "│   "
+                name = entry.name
+                current = last_branch if i == last else branch
                 
-                # Add file/folder indicator
-                if os.path.isdir(entry_path):
-                    display_name = f"📁 {entry}/"
+                # Add file/folder indicator, recursing for directories
+                if i < len(dirs):
+                    append(f"{current}📁 {name}/")
+                    _build_tree(entry.path, last_child_prefix if i == last else child_prefix, depth + 1)
                 else:
                     # Add file type indicator
-                    if entry.endswith('.py'):
-                        display_name = f"🐍 {entry}"
-                    elif entry.endswith(('.txt', '.md', '.rst')):
-                        display_name = f"📄 {entry}"
-                    elif entry.endswith(('.json', '.yaml', '.yml', '.toml')):
-                        display_name = f"⚙️ {entry}"
-                    else:
-                        display_name = f"📄 {entry}"
-                
-                lines.append(f"{prefix}{current}{display_name}")
-                
-                # Recurse for directories
-                if os.path.isdir(entry_path):
-                    lines.extend(_build_tree(entry_path, prefix + extension, depth + 1))
+                    dot = name.rfind('.')
+                    icon = _EXT_ICONS.get(name[dot:], "📄") if dot >= 0 else "📄"
+                    append(f"{current}{icon} {name}")
         
         except PermissionError:
-            lines.append(f"{prefix}[Permission Denied]")
-        
-        return lines
+            append(f"{prefix}[Permission Denied]")
     
     # Build the tree
-    tree_lines = [f"📦 {os.path.basename(abs_path) or 'sandbox'}/"]
-    tree_lines.extend(_build_tree(abs_path))
+    _build_tree(abs_path)
+    tree = "\n".join(tree_lines)
     
-    return "\n".join(tree_lines)
+    with _tree_cache_lock:
+        _tree_cache[key] = (tuple(dir_versions), tree)
+        _tree_cache.move_to_end(key)
+        if len(_tree_cache) > TREE_CACHE_SIZE:
+            _tree_cache.popitem(last=False)
+    return tree
 
 
 def format_and_analyze(path: str) -> Dict[str, Any]:
@@ -1018,9 +2128,16 @@ def format_and_analyze(path: str) -> Dict[str, Any]:
         'recommendations': []
     }
     
-    # Get initial quality score
+    # Get initial quality score while Black works out the formatting.
+    # Black runs in check mode here, so nothing is written while the
+    # analysis may still be reading the file; the real call below is then
+    # served from the format memo.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        before_future = executor.submit(analyze_code_quality, path)
+        executor.submit(apply_black_formatting, path, check_only=True)
+    
     try:
-        initial_analysis = analyze_code_quality(path)
+        initial_analysis = before_future.result()
         results['analysis_before'] = initial_analysis
         initial_score = initial_analysis.get('pylint_score')
     except Exception:
@@ -1076,6 +2193,139 @@ def format_and_analyze(path: str) -> Dict[str, Any]:
 # INCREMENT 5: THE TIME MACHINE - Backup & Restore
 # ============================================================================
 
+def _clone_file(src: str, dst: str) -> None:
+    """
+    shutil.copy2, but with the data moved by copy_file_range where the
+    platform has it: the kernel copies without a trip through user space,
+    and filesystems with copy-on-write extents (btrfs, XFS) just share them.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while True:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                    if n == 0:
+                        break
+                    copied += n
+            # Some filesystems report no data instead of failing
+            if copied == size:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            # EXDEV across filesystems on older kernels, ENOSYS, EINVAL...
+            pass
+    shutil.copy2(src, dst)
+
+
+def _snapshot_tree(src: str, dst: str, link_dest: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Copies the directory tree src to dst, counting files and bytes on the way.
+    
+    Files whose size and mtime match the same file in the link_dest
+    snapshot are hardlinked to it instead of copied (as rsync --link-dest
+    does), so unchanged files cost one link and no disk space. Only
+    snapshots share inodes: agents edit the sandbox in place, so it is
+    always copied into and out of.
+    
+    Args:
+        src: Directory to copy
+        dst: Destination directory (must not exist)
+        link_dest: Previous snapshot of src, or None to copy everything
+        
+    Returns:
+        Tuple of (number of files, total size in bytes)
+    """
+    os.makedirs(dst)
+    files = 0
+    size_bytes = 0
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            previous = os.path.join(link_dest, entry.name) if link_dest else None
+            # Symlinks are followed, as copytree(symlinks=False) did
+            if entry.is_dir():
+                sub_files, sub_size = _snapshot_tree(entry.path, target, previous)
+                files += sub_files
+                size_bytes += sub_size
+                continue
+            
+            st = entry.stat()
+            linked = False
+            if previous is not None:
+                try:
+                    prev_st = os.stat(previous)
+                    if (stat.S_ISREG(prev_st.st_mode) and prev_st.st_size == st.st_size
+                            and prev_st.st_mtime_ns == st.st_mtime_ns):
+                        os.link(previous, target)
+                        linked = True
+                except OSError:
+                    # Missing in the previous snapshot, or links unsupported (EXDEV, EPERM...)
+                    pass
+            if not linked:
+                _clone_file(entry.path, target)
+            files += 1
+            size_bytes += st.st_size
+    return files, size_bytes
+
+
+def _latest_backup(exclude: Optional[str] = None) -> Optional[str]:
+    """Name of the most recently modified backup (other than exclude), or None."""
+    latest = None
+    latest_mtime = None
+    with os.scandir(BACKUP_DIR) as entries:
+        for entry in entries:
+            if entry.name == exclude or not entry.is_dir():
+                continue
+            mtime = entry.stat().st_mtime
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = entry.name, mtime
+    return latest
+
+
+def _tree_files(directory: str) -> List[os.DirEntry]:
+    """Lists the files under directory, recursively, without stat-ing them."""
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except OSError:
+        return []
+    files = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            files.extend(_tree_files(entry.path))
+        else:
+            files.append(entry)
+    return files
+
+
+def _file_size(entry: os.DirEntry) -> int:
+    """Size of a listed file, 0 if it vanished or cannot be stat-ed."""
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+
+def _file_sizes(entries: List[os.DirEntry]) -> List[int]:
+    """
+    Sizes of the listed files, in order.
+    
+    Large listings are stat-ed from a thread pool: stat() releases the GIL,
+    so on cold or networked filesystems the lookups overlap instead of
+    waiting on each other.
+    """
+    if len(entries) < STAT_POOL_THRESHOLD:
+        return [_file_size(entry) for entry in entries]
+    # One slice per worker: a future per file would cost more than its stat
+    step = -(-len(entries) // STAT_POOL_WORKERS)
+    slices = [entries[i:i + step] for i in range(0, len(entries), step)]
+    with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+        parts = executor.map(lambda part: [_file_size(entry) for entry in part], slices)
+        return [size for part in parts for size in part]
+
+
 def backup_sandbox(backup_name: Optional[str] = None) -> Dict[str, Any]:
     """
     Creates a backup of the entire sandbox directory.
@@ -1121,20 +2371,12 @@ def backup_sandbox(backup_name: Optional[str] = None) -> Dict[str, Any]:
         if os.path.exists(backup_path):
             shutil.rmtree(backup_path)
         
-        # Copy the entire sandbox directory
-        shutil.copytree(SANDBOX_DIR, backup_path, symlinks=False)
-        
-        # Count files and calculate size
-        files_backed_up = 0
-        size_bytes = 0
-        for root, dirs, files in os.walk(backup_path):
-            files_backed_up += len(files)
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    size_bytes += os.path.getsize(file_path)
-                except OSError:
-                    pass
+        # Snapshot the sandbox, sharing unchanged files with the latest backup
+        link_dest = _latest_backup(exclude=backup_name)
+        files_backed_up, size_bytes = _snapshot_tree(
+            SANDBOX_DIR, backup_path,
+            os.path.join(BACKUP_DIR, link_dest) if link_dest else None
+        )
         
         return {
             'success': True,
@@ -1204,20 +2446,15 @@ def restore_sandbox(backup_name: Optional[str] = None, confirm: bool = True) ->
         # Find the backup to restore
         if backup_name is None:
             # Get most recent backup
-            backups = [d for d in os.listdir(BACKUP_DIR) 
-                      if os.path.isdir(os.path.join(BACKUP_DIR, d))]
+            backup_name = _latest_backup()
             
-            if not backups:
+            if backup_name is None:
                 return {
                     'success': False,
                     'backup_used': None,
                     'files_restored': 0,
                     'summary': "No backups found"
                 }
-            
-            # Sort by modification time (most recent first)
-            backups.sort(key=lambda x: os.path.getmtime(os.path.join(BACKUP_DIR, x)), reverse=True)
-            backup_name = backups[0]
         
         backup_path = os.path.join(BACKUP_DIR, backup_name)
         
@@ -1230,17 +2467,30 @@ def restore_sandbox(backup_name: Optional[str] = None, confirm: bool = True) ->
                 'summary': f"Backup '{backup_name}' not found"
             }
         
-        # Delete current sandbox
-        if os.path.exists(SANDBOX_DIR):
-            shutil.rmtree(SANDBOX_DIR)
-        
-        # Restore from backup
-        shutil.copytree(backup_path, SANDBOX_DIR, symlinks=False)
+        # Restore from backup into a sibling staging directory first (copied:
+        # hardlinks would let in-place edits reach the backup), so the
+        # sandbox is never missing or half-restored
+        suffix = f"{os.getpid()}-{time.time_ns()}"
+        staging = f"{SANDBOX_DIR}.restoring-{suffix}"
+        try:
+            files_restored, _ = _snapshot_tree(backup_path, staging)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
         
-        # Count restored files
-        files_restored = 0
-        for root, dirs, files in os.walk(SANDBOX_DIR):
-            files_restored += len(files)
+        # Swap it in with two renames, then delete the old sandbox in the background
+        old_sandbox = None
+        if os.path.exists(SANDBOX_DIR):
+            old_sandbox = f"{SANDBOX_DIR}.old-{suffix}"
+            os.rename(SANDBOX_DIR, old_sandbox)
+        os.rename(staging, SANDBOX_DIR)
+        _invalidate_read_cache()
+        # The warm pytest worker may still hold the replaced tree (modules,
+        # a cwd inside it); start the next run_pytest from a fresh one
+        with _pytest_worker_lock:
+            _stop_pytest_worker()
+        if old_sandbox is not None:
+            threading.Thread(target=shutil.rmtree, args=(old_sandbox, True)).start()
         
         return {
             'success': True,
@@ -1288,25 +2538,25 @@ def list_backups() -> Dict[str, Any]:
         backups_info = []
         total_size = 0
         
-        for backup_name in os.listdir(BACKUP_DIR):
-            backup_path = os.path.join(BACKUP_DIR, backup_name)
-            
-            if not os.path.isdir(backup_path):
-                continue
+        with os.scandir(BACKUP_DIR) as it:
+            backup_entries = [entry for entry in it if entry.is_dir()]
+        
+        # List every backup first so all file sizes are fetched in one batch
+        backup_files = [_tree_files(entry.path) for entry in backup_entries]
+        sizes = _file_sizes([f for files in backup_files for f in files])
+        
+        offset = 0
+        for entry, files in zip(backup_entries, backup_files):
+            backup_name = entry.name
+            backup_path = entry.path
             
             # Get metadata
-            mtime = os.path.getmtime(backup_path)
+            mtime = entry.stat().st_mtime
             
             # Count files and size
-            file_count = 0
-            size_bytes = 0
-            for root, dirs, files in os.walk(backup_path):
-                file_count += len(files)
-                for file in files:
-                    try:
-                        size_bytes += os.path.getsize(os.path.join(root, file))
-                    except OSError:
-                        pass
+            file_count = len(files)
+            size_bytes = sum(sizes[offset:offset + file_count])
+            offset += file_count
             
             total_size += size_bytes
             
@@ -1403,6 +2653,15 @@ def get_tools_documentation(format_type: str = 'detailed', category: str = None)
         # Get just filesystem tools
         fs_docs = get_tools_documentation(category='filesystem')
     """
+    if format_type not in ('json', 'compact', 'markdown'):
+        format_type = 'detailed'
+    
+    # The registry is fixed at import, so each rendering is built once
+    key = (format_type, category or None)
+    cached = _docs_cache.get(key)
+    if cached is not None:
+        return cached
+    
     # Filter tools by category if specified
     if category:
         tools_to_document = {
@@ -1413,13 +2672,30 @@ def get_tools_documentation(format_type: str = 'detailed', category: str = None)
         tools_to_document = TOOLS_MAPPING
     
     if format_type == 'json':
-        return _generate_json_documentation(tools_to_document)
+        docs = _generate_json_documentation(tools_to_document)
     elif format_type == 'compact':
-        return _generate_compact_documentation(tools_to_document)
+        docs = _generate_compact_documentation(tools_to_document)
     elif format_type == 'markdown':
-        return _generate_markdown_documentation(tools_to_document)
+        docs = _generate_markdown_documentation(tools_to_document)
     else:  # detailed (default)
-        return _generate_detailed_documentation(tools_to_document)
+        docs = _generate_detailed_documentation(tools_to_document)
+    
+    # Unknown categories are not kept: the key space stays bounded
+    if not category or tools_to_document:
+        _docs_cache[key] = docs
+    return docs
+
+
+def _tool_spec(tool_func: Callable) -> Tuple[inspect.Signature, Optional[str]]:
+    """
+    Signature and cleaned docstring of a tool, computed once per function
+    (shared by the documentation generators and the dispatcher).
+    """
+    spec = _tool_specs.get(tool_func)
+    if spec is None:
+        spec = (inspect.signature(tool_func), inspect.getdoc(tool_func))
+        _tool_specs[tool_func] = spec
+    return spec
 
 
 def _generate_detailed_documentation(tools: Dict[str, Callable]) -> str:
@@ -1458,7 +2734,7 @@ def _generate_detailed_documentation(tools: Dict[str, Callable]) -> str:
             lines.append(f"Description: {metadata.get('description', 'No description')}")
             
             # Get function signature
-            sig = inspect.signature(tool_func)
+            sig, docstring = _tool_spec(tool_func)
             params = []
             for param_name, param in sig.parameters.items():
                 if param.default == inspect.Parameter.empty:
@@ -1478,7 +2754,6 @@ def _generate_detailed_documentation(tools: Dict[str, Callable]) -> str:
                 lines.append(f"Optional Arguments: {', '.join(optional)}")
             
             # Docstring
-            docstring = inspect.getdoc(tool_func)
             if docstring:
                 lines.append("\nDocumentation:")
                 for line in docstring.split('\n'):
@@ -1492,9 +2767,10 @@ def _generate_detailed_documentation(tools: Dict[str, Callable]) -> str:
 
 def _generate_compact_documentation(tools: Dict[str, Callable]) -> str:
     """Generate compact one-line documentation for tools."""
-    lines = []
-    lines.append("TOOLS QUICK REFERENCE")
-    lines.append("=" * 80)
+    buf = io.StringIO()
+    w = buf.write
+    w("TOOLS QUICK REFERENCE\n")
+    w("=" * 80)
     
     # Group by category
     categories = {}
@@ -1506,7 +2782,7 @@ def _generate_compact_documentation(tools: Dict[str, Callable]) -> str:
         categories[cat].append(tool_name)
     
     for category in sorted(categories.keys()):
-        lines.append(f"\n{category.upper()}:")
+        w(f"\n\n{category.upper()}:")
         for tool_name in sorted(categories[category]):
             metadata = TOOLS_METADATA.get(tool_name, {})
             required = metadata.get('required_args', [])
@@ -1517,10 +2793,9 @@ def _generate_compact_documentation(tools: Dict[str, Callable]) -> str:
                 args_str += f" [, {', '.join(optional)}]"
             
             desc = metadata.get('description', 'No description')
-            lines.append(f"  • {tool_name}({args_str})")
-            lines.append(f"    {desc}")
+            w(f"\n  • {tool_name}({args_str})\n    {desc}")
     
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 
 def _generate_json_documentation(tools: Dict[str, Callable]) -> str:
@@ -1531,18 +2806,23 @@ def _generate_json_documentation(tools: Dict[str, Callable]) -> str:
         metadata = TOOLS_METADATA.get(tool_name, {})
         
         # Get function signature details
-        sig = inspect.signature(tool_func)
+        sig, docstring = _tool_spec(tool_func)
         parameters = {}
         
         for param_name, param in sig.parameters.items():
+            required = param.default is inspect.Parameter.empty
+            # Defaults are given as JSON values ("88", not "'88'"); others as text
+            default = None if required else param.default
+            if not isinstance(default, (str, int, float, bool, type(None))):
+                default = str(default)
             param_info = {
-                'required': param.default == inspect.Parameter.empty,
-                'default': None if param.default == inspect.Parameter.empty else repr(param.default)
+                'required': required,
+                'default': default
             }
             
-            # Try to get type annotation
-            if param.annotation != inspect.Parameter.empty:
-                param_info['type'] = str(param.annotation)
+            # Try to get type annotation ("Optional[str]", not "<class 'str'>")
+            if param.annotation is not inspect.Parameter.empty:
+                param_info['type'] = inspect.formatannotation(param.annotation)
             
             parameters[param_name] = param_info
         
@@ -1552,7 +2832,7 @@ def _generate_json_documentation(tools: Dict[str, Callable]) -> str:
             'required_args': metadata.get('required_args', []),
             'optional_args': metadata.get('optional_args', []),
             'parameters': parameters,
-            'docstring': inspect.getdoc(tool_func)
+            'docstring': docstring
         }
     
     return json.dumps(docs, indent=2)
@@ -1560,9 +2840,10 @@ def _generate_json_documentation(tools: Dict[str, Callable]) -> str:
 
 def _generate_markdown_documentation(tools: Dict[str, Callable]) -> str:
     """Generate Markdown documentation for tools."""
-    lines = []
-    lines.append("# Tools Documentation\n")
-    lines.append(f"**Total Tools:** {len(tools)}\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Tools Documentation\n\n")
+    w(f"**Total Tools:** {len(tools)}\n\n")
     
     # Group by category
     categories = {}
@@ -1573,38 +2854,38 @@ def _generate_markdown_documentation(tools: Dict[str, Callable]) -> str:
             categories[cat] = []
         categories[cat].append(tool_name)
     
-    # Document each category
+    # Document each category (every block ends with a newline; the last
+    # one is dropped below, as a join of lines would)
     for category in sorted(categories.keys()):
-        lines.append(f"\n## {category.upper()}\n")
+        w(f"\n## {category.upper()}\n\n")
         
         for tool_name in sorted(categories[category]):
             tool_func = tools[tool_name]
             metadata = TOOLS_METADATA.get(tool_name, {})
             
-            lines.append(f"### `{tool_name}()`\n")
-            lines.append(f"**Description:** {metadata.get('description', 'No description')}\n")
+            w(f"### `{tool_name}()`\n\n")
+            w(f"**Description:** {metadata.get('description', 'No description')}\n\n")
             
             # Arguments
             required = metadata.get('required_args', [])
             optional = metadata.get('optional_args', [])
             
             if required or optional:
-                lines.append("**Arguments:**")
+                w("**Arguments:**\n")
                 for arg in required:
-                    lines.append(f"- `{arg}` (required)")
+                    w(f"- `{arg}` (required)\n")
                 for arg in optional:
-                    lines.append(f"- `{arg}` (optional)")
-                lines.append("")
+                    w(f"- `{arg}` (optional)\n")
+                w("\n")
             
             # Docstring as code block
-            docstring = inspect.getdoc(tool_func)
+            _, docstring = _tool_spec(tool_func)
             if docstring:
-                lines.append("**Details:**")
-                lines.append("```")
-                lines.append(docstring)
-                lines.append("```\n")
+                w("**Details:**\n```\n")
+                w(docstring)
+                w("\n```\n\n")
     
-    return '\n'.join(lines)
+    return buf.getvalue()[:-1]
 
 
 # ============================================================================
@@ -1622,6 +2903,7 @@ TOOLS_MAPPING: Dict[str, Callable] = {
     # Increment 2: Inspector (Smart Analysis)
     'check_syntax': check_syntax,
     'run_pylint': run_pylint,
+    'run_pylint_batch': run_pylint_batch,
     'analyze_code_quality': analyze_code_quality,
     
     # Increment 3: Judge (Execution & Testing)
@@ -1631,6 +2913,7 @@ TOOLS_MAPPING: Dict[str, Callable] = {
     
     # Increment 4: Polisher (Quality & Formatter)
     'apply_black_formatting': apply_black_formatting,
+    'apply_black_formatting_batch': apply_black_formatting_batch,
     'get_project_structure': get_project_structure,
     'format_and_analyze': format_and_analyze,
     
@@ -1680,7 +2963,13 @@ TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         'description': 'Run pylint analysis on a Python file',
         'category': 'analysis',
         'required_args': ['path'],
-        'optional_args': ['return_full_report'],
+        'optional_args': ['return_full_report', 'jobs', 'need_score'],
+    },
+    'run_pylint_batch': {
+        'description': 'Run pylint once over several Python files (memoized per file)',
+        'category': 'analysis',
+        'required_args': ['paths'],
+        'optional_args': ['jobs'],
     },
     'analyze_code_quality': {
         'description': 'Comprehensive code quality analysis (syntax + pylint)',
@@ -1712,6 +3001,12 @@ TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
         'required_args': ['path'],
         'optional_args': ['line_length', 'check_only'],
     },
+    'apply_black_formatting_batch': {
+        'description': 'Format several Python files with one Black run (memoized per source)',
+        'category': 'formatting',
+        'required_args': ['paths'],
+        'optional_args': ['line_length', 'check_only'],
+    },
     'get_project_structure': {
         'description': 'Get a tree view of the sandbox directory structure',
         'category': 'formatting',
@@ -1756,6 +3051,37 @@ TOOLS_METADATA: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# Required arguments of each tool as a set, for validate_tool_call
+_REQUIRED_ARGS: Dict[str, frozenset] = {
+    name: frozenset(meta.get('required_args', ())) for name, meta in TOOLS_METADATA.items()
+}
+
+# Sorted tool names, overall and per category, for the listing helpers
+_ALL_TOOLS_SORTED: List[str] = sorted(TOOLS_MAPPING)
+_TOOLS_BY_CATEGORY: Dict[str, List[str]] = {}
+for _name, _meta in TOOLS_METADATA.items():
+    _TOOLS_BY_CATEGORY.setdefault(_meta.get('category', 'other'), []).append(_name)
+for _tools in _TOOLS_BY_CATEGORY.values():
+    _tools.sort()
+del _name, _meta, _tools
+
+
+def _format_type_error(e: Exception, tool_name: str) -> Tuple[str, str]:
+    """Invalid arguments: the message lists the parameters the tool expects."""
+    sig, _ = _tool_spec(TOOLS_MAPPING[tool_name])
+    params = list(sig.parameters.keys())
+    return (f"Invalid arguments for '{tool_name}': {str(e)}. Expected parameters: {params}",
+            'InvalidArgumentsError')
+
+
+# execute_tool error reporting: exception class -> (exception, tool_name) -> (message, error_type)
+_ERROR_FORMATTERS: Dict[type, Callable[[Exception, str], Tuple[str, str]]] = {
+    TypeError: _format_type_error,
+    FileNotFoundError: lambda e, tool_name: (f"File not found: {str(e)}", 'FileNotFoundError'),
+    ValueError: lambda e, tool_name: (f"Invalid value: {str(e)}", 'ValueError'),
+    PermissionError: lambda e, tool_name: (f"Permission denied: {str(e)}", 'PermissionError'),
+}
+
 
 def execute_tool(tool_name: str, **kwargs) -> Dict[str, Any]:
     """
@@ -1809,53 +3135,21 @@ def execute_tool(tool_name: str, **kwargs) -> Dict[str, Any]:
                 'error_type': None
             }
             
-        except TypeError as e:
-            # Invalid arguments
-            sig = inspect.signature(tool_function)
-            params = list(sig.parameters.keys())
-            
-            return {
-                'status': 'error',
-                'tool': tool_name,
-                'error': f"Invalid arguments for '{tool_name}': {str(e)}. Expected parameters: {params}",
-                'error_type': 'InvalidArgumentsError',
-                'output': None
-            }
-            
-        except FileNotFoundError as e:
-            return {
-                'status': 'error',
-                'tool': tool_name,
-                'error': f"File not found: {str(e)}",
-                'error_type': 'FileNotFoundError',
-                'output': None
-            }
-            
-        except ValueError as e:
-            return {
-                'status': 'error',
-                'tool': tool_name,
-                'error': f"Invalid value: {str(e)}",
-                'error_type': 'ValueError',
-                'output': None
-            }
-            
-        except PermissionError as e:
-            return {
-                'status': 'error',
-                'tool': tool_name,
-                'error': f"Permission denied: {str(e)}",
-                'error_type': 'PermissionError',
-                'output': None
-            }
-            
         except Exception as e:
-            # Catch-all for any other errors
+            # First formatter along the exception's MRO, so subclasses
+            # (UnicodeDecodeError -> ValueError...) are reported as before
+            formatter = next((_ERROR_FORMATTERS[cls] for cls in type(e).__mro__ if cls in _ERROR_FORMATTERS), None)
+            if formatter is not None:
+                error, error_type = formatter(e, tool_name)
+            else:
+                # Catch-all for any other errors
+                error, error_type = f"Unexpected error: {type(e).__name__}: {str(e)}", type(e).__name__
+            
             return {
                 'status': 'error',
                 'tool': tool_name,
-                'error': f"Unexpected error: {type(e).__name__}: {str(e)}",
-                'error_type': type(e).__name__,
+                'error': error,
+                'error_type': error_type,
                 'output': None
             }
             
@@ -1880,15 +3174,10 @@ def list_available_tools(category: Optional[str] = None) -> List[str]:
     Returns:
         List of tool names
     """
+    # Copies, so callers can't alter the precomputed lists
     if category is None:
-        return sorted(TOOLS_MAPPING.keys())
-    
-    # Filter by category
-    tools = [
-        name for name, meta in TOOLS_METADATA.items()
-        if meta.get('category') == category
-    ]
-    return sorted(tools)
+        return list(_ALL_TOOLS_SORTED)
+    return list(_TOOLS_BY_CATEGORY.get(category, ()))
 
 
 def get_tool_info(tool_name: str) -> Dict[str, Any]:
@@ -1911,7 +3200,7 @@ def get_tool_info(tool_name: str) -> Dict[str, Any]:
     metadata = TOOLS_METADATA.get(tool_name, {})
     
     # Get function signature
-    sig = inspect.signature(tool_function)
+    sig, _ = _tool_spec(tool_function)
     params = {}
     for param_name, param in sig.parameters.items():
         params[param_name] = {
@@ -1939,19 +3228,7 @@ def get_tools_by_category() -> Dict[str, List[str]]:
     Returns:
         Dictionary mapping categories to lists of tool names
     """
-    categories: Dict[str, List[str]] = {}
-    
-    for tool_name, metadata in TOOLS_METADATA.items():
-        category = metadata.get('category', 'other')
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(tool_name)
-    
-    # Sort tools within each category
-    for category in categories:
-        categories[category].sort()
-    
-    return categories
+    return {category: list(tools) for category, tools in _TOOLS_BY_CATEGORY.items()}
 
 
 def validate_tool_call(tool_name: str, **kwargs) -> Dict[str, Any]:
@@ -1976,13 +3253,11 @@ def validate_tool_call(tool_name: str, **kwargs) -> Dict[str, Any]:
         }
     
     tool_function = TOOLS_MAPPING[tool_name]
-    metadata = TOOLS_METADATA.get(tool_name, {})
-    
-    # Check required arguments
-    required_args = metadata.get('required_args', [])
-    missing_args = [arg for arg in required_args if arg not in kwargs]
     
-    if missing_args:
+    # Check required arguments (one subset test; the ordered list only for the error)
+    if not _REQUIRED_ARGS.get(tool_name, frozenset()).issubset(kwargs):
+        required_args = TOOLS_METADATA[tool_name]['required_args']
+        missing_args = [arg for arg in required_args if arg not in kwargs]
         return {
             'valid': False,
             'error': f"Missing required arguments: {missing_args}",
@@ -1991,7 +3266,7 @@ def validate_tool_call(tool_name: str, **kwargs) -> Dict[str, Any]:
         }
     
     # Get function signature for additional validation
-    sig = inspect.signature(tool_function)
+    sig, _ = _tool_spec(tool_function)
     try:
         sig.bind(**kwargs)
         return {
@@ -5,9 +5,13 @@ Toolsmith tool for analyzing code changes.
 """
 
 import difflib
+import re
 from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
+# A `def` line: group 1 is the whole line, group 2 the name (text up to "(")
+_DEF_LINE_RE = re.compile(r'^([ \t\f\v]*def ([^(\r\n]*)[^\r\n]*)', re.M)
+
 
 @dataclass
 class DiffStats:
@@ -48,20 +52,23 @@ class CodeDiff:
         before_lines = before.splitlines(keepends=False)
         after_lines = after.splitlines(keepends=False)
         
-        # Use difflib for detailed comparison
-        diff = difflib.unified_diff(before_lines, after_lines, lineterm='')
-        diff_list = list(diff)
-        
-        # Calculate statistics
-        additions = sum(1 for line in diff_list if line.startswith('+') and not line.startswith('+++'))
-        deletions = sum(1 for line in diff_list if line.startswith('-') and not line.startswith('---'))
+        # One line-level comparison gives both the changed lines and the similarity
+        matcher = difflib.SequenceMatcher(None, before_lines, after_lines, autojunk=False)
         
         # Extract actual changes
-        added_lines = [line[1:] for line in diff_list if line.startswith('+') and not line.startswith('+++')]
-        removed_lines = [line[1:] for line in diff_list if line.startswith('-') and not line.startswith('---')]
+        added_lines = []
+        removed_lines = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                continue
+            removed_lines.extend(before_lines[i1:i2])
+            added_lines.extend(after_lines[j1:j2])
+        
+        # Calculate statistics
+        additions = len(added_lines)
+        deletions = len(removed_lines)
         
-        # Calculate similarity ratio (0.0 to 1.0)
-        matcher = difflib.SequenceMatcher(None, before, after)
+        # Calculate similarity ratio (0.0 to 1.0), share of matching lines
         similarity = matcher.ratio()
         
         stats = DiffStats(
@@ -110,6 +117,10 @@ class CodeDiff:
         Returns:
             Unified diff format string
         """
+        # Identical versions have an empty patch; skip splitting and matching
+        if before == after:
+            return ''
+        
         before_lines = before.splitlines(keepends=True)
         after_lines = after.splitlines(keepends=True)
         
@@ -135,14 +146,9 @@ class CodeDiff:
         Returns:
             Dict mapping function names to their status: "added", "removed", "modified"
         """
-        def extract_functions(code: str) -> Dict[str, int]:
-            """Extract function definitions and their line hashes."""
-            functions = {}
-            for i, line in enumerate(code.splitlines()):
-                if line.strip().startswith("def "):
-                    func_name = line.split("def ")[1].split("(")[0]
-                    functions[func_name] = hash(line)
-            return functions
+        def extract_functions(code: str) -> Dict[str, str]:
+            """Extract function definitions and their `def` lines."""
+            return {m.group(2): m.group(1) for m in _DEF_LINE_RE.finditer(code)}
         
         before_funcs = extract_functions(before)
         after_funcs = extract_functions(after)
@@ -163,6 +169,15 @@ class CodeDiff:
         return changes
 
 
+# difflib.Differ line prefix -> change type reported by get_colored_diff
+_DIFFER_PREFIXES = {
+    '- ': "removed",
+    '+ ': "added",
+    '? ': "hint",
+    '  ': "unchanged",
+}
+
+
 class LineDiffAnalyzer:
     """Analyze line-by-line differences."""
     
@@ -182,17 +197,12 @@ class LineDiffAnalyzer:
         after_lines = after.splitlines()
         
         differ = difflib.Differ()
-        diff_result = list(differ.compare(before_lines, after_lines))
         
+        # One lookup on the two-character Differ prefix per line
         changes = []
-        for line in diff_result:
-            if line.startswith('- '):
-                changes.append({"type": "removed", "line": line[2:]})
-            elif line.startswith('+ '):
-                changes.append({"type": "added", "line": line[2:]})
-            elif line.startswith('? '):
-                changes.append({"type": "hint", "line": line[2:]})
-            elif line.startswith('  '):
-                changes.append({"type": "unchanged", "line": line[2:]})
+        for line in differ.compare(before_lines, after_lines):
+            change_type = _DIFFER_PREFIXES.get(line[:2])
+            if change_type is not None:
+                changes.append({"type": change_type, "line": line[2:]})
         
         return changes
@@ -5,8 +5,15 @@ Enforces sandbox security: agents cannot read/write outside target_dir.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+# read_all_python_files reads serially below this many files; a pool
+# only pays off once there are enough reads to overlap
+READ_POOL_THRESHOLD = 512
+# Threads used by read_all_python_files for large trees
+READ_WORKERS = 32
 
 
 class SandboxSecurityError(Exception):
@@ -32,6 +39,10 @@ class CodeReader:
             raise ValueError(f"Target directory not found: {target_dir}")
         if not self.target_dir.is_dir():
             raise ValueError(f"Target path is not a directory: {target_dir}")
+        
+        # Result of the last _scan, with the mtime of every directory it listed
+        self._py_file_cache: Optional[List[Path]] = None
+        self._dir_versions: List[Tuple[str, int]] = []
     
     def _check_sandbox(self, file_path: Path) -> None:
         """
@@ -52,22 +63,78 @@ class CodeReader:
                 f"   Requested:  {file_path.resolve()}"
             )
 
+    def _scan(self) -> List[Path]:
+        """
+        Find every Python file under target_dir, like rglob("*.py").
+        
+        The list is reused until one of the walked directories changes
+        mtime, which happens whenever an entry is added, removed or renamed
+        in it. A hit costs one stat per directory instead of a full walk.
+        """
+        if self._py_file_cache is not None and all(
+            self._dir_mtime(directory) == mtime_ns
+            for directory, mtime_ns in self._dir_versions
+        ):
+            return self._py_file_cache
+        
+        dir_versions = []
+        paths = []
+        
+        def _walk(directory: str) -> None:
+            try:
+                # Stat before listing, so a change made meanwhile invalidates the cache
+                dir_versions.append((directory, os.stat(directory).st_mtime_ns))
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                return
+            subdirs = []
+            for entry in entries:
+                if entry.name.endswith(".py"):
+                    paths.append(Path(entry.path))
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+            for subdir in subdirs:
+                _walk(subdir)
+        
+        _walk(str(self.target_dir))
+        self._py_file_cache = paths
+        self._dir_versions = dir_versions
+        return paths
+    
+    @staticmethod
+    def _dir_mtime(directory: str) -> Optional[int]:
+        """mtime_ns of directory, or None if it is gone."""
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
     def read_all_python_files(self) -> Dict[str, str]:
         """
         Read all Python files from target directory (recursive).
         
+        Large trees are read from a thread pool: reads release the GIL, so
+        on a cold cache the disk latencies overlap instead of adding up.
+        
         Returns:
             Dict mapping relative filepath -> file content
         """
-        files = {}
-        for py_file in self.target_dir.rglob("*.py"):
+        paths = self._scan()
+        
+        def _read(py_file: Path) -> Optional[Tuple[str, str]]:
             try:
-                rel_path = py_file.relative_to(self.target_dir)
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    files[str(rel_path)] = f.read()
+                return str(py_file.relative_to(self.target_dir)), py_file.read_text(encoding='utf-8')
             except (UnicodeDecodeError, IOError) as e:
                 print(f"⚠️ Skipping {py_file}: {e}")
-        return files
+                return None
+        
+        if len(paths) < READ_POOL_THRESHOLD:
+            results = map(_read, paths)
+        else:
+            with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(paths))) as executor:
+                results = list(executor.map(_read, paths))
+        return dict(result for result in results if result is not None)
 
     def read_file(self, relative_path: str) -> str:
         """
@@ -118,11 +185,7 @@ class CodeReader:
         Returns:
             List of relative filepaths
         """
-        files = []
-        for py_file in self.target_dir.rglob("*.py"):
-            rel_path = py_file.relative_to(self.target_dir)
-            files.append(str(rel_path))
-        return sorted(files)
+        return sorted(str(py_file.relative_to(self.target_dir)) for py_file in self._scan())
 
     def get_file_size(self, relative_path: str) -> int:
         """Get file size in bytes."""
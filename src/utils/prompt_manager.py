@@ -8,7 +8,7 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 
 _PROMPTS_PATH = Path(__file__).resolve().parent.parent / "prompts" / "system_prompts.json"
@@ -25,6 +25,11 @@ def _load_prompts(path: str) -> Dict[str, str]:
         return json.load(handle)
 
 
+@lru_cache(maxsize=512)
+def _format_template(template: str, items: Tuple[Tuple[str, str], ...]) -> str:
+    return template.format_map(_SafeDict(items))
+
+
 class PromptManager:
     """
     Loads prompts from a JSON file and formats them with runtime context.
@@ -41,4 +46,8 @@ class PromptManager:
 
     def format(self, name: str, **kwargs: str) -> str:
         template = self.get(name)
-        return template.format_map(_SafeDict(kwargs))
+        # Identical (template, context) pairs recur across retries; reuse the rendered text
+        try:
+            return _format_template(template, tuple(sorted(kwargs.items())))
+        except TypeError:  # unhashable context value
+            return template.format_map(_SafeDict(kwargs))
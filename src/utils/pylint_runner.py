@@ -3,10 +3,33 @@ Pylint Runner Utility
 Executes pylint analysis on Python files and captures results.
 """
 
+import io
 import subprocess
 import json
+import threading
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+try:
+    from astroid import MANAGER as ASTROID_MANAGER
+    from pylint.lint import Run as PylintRun
+    from pylint.reporters.text import TextReporter
+except ImportError:
+    PylintRun = None
+
+# pylint keeps global state (astroid cache, sys.path tweaks); in-process runs must not overlap
+_IN_PROCESS_LOCK = threading.Lock()
+
+
+def _parse_score(output: str) -> Optional[float]:
+    """Extract the score from pylint's "Your code has been rated at 8.5/10" line."""
+    parts = output.split("Your code has been rated at ")
+    if len(parts) > 1:
+        try:
+            return float(parts[1].split("/")[0].strip())
+        except ValueError:
+            pass
+    return None
 
 
 class PylintRunner:
@@ -72,18 +95,10 @@ class PylintRunner:
             )
             
             # Extract score from text output
-            score = 0.0
             output = result_text.stdout + result_text.stderr
-            
-            if "Your code has been rated at" in output:
-                # Extract score like "8.5/10"
-                parts = output.split("Your code has been rated at ")
-                if len(parts) > 1:
-                    score_str = parts[1].split("/")[0].strip()
-                    try:
-                        score = float(score_str)
-                    except ValueError:
-                        pass
+            score = _parse_score(output)
+            if score is None:
+                score = 0.0
             
             return {
                 "success": True,
@@ -107,6 +122,56 @@ class PylintRunner:
                 "raw_output": ""
             }
 
+    def get_score(self, relative_path: str, in_process: bool = True) -> Optional[float]:
+        """
+        Get the pylint score of a file.
+        
+        In-process runs avoid a Python interpreter startup and pylint import
+        per call, which dominates the cost of scoring small files repeatedly,
+        but they are serialized behind a lock. Callers scoring from several
+        threads at once should pass in_process=False so the runs overlap.
+        
+        Args:
+            relative_path: Path relative to target_dir
+            in_process: Run pylint in this interpreter when it is importable
+            
+        Returns:
+            Pylint score (0-10), or None if pylint could not score the file
+        """
+        file_path = self.target_dir / relative_path
+        if not file_path.exists():
+            return None
+        
+        if PylintRun is None or not in_process:
+            try:
+                result = subprocess.run(
+                    ["python", "-m", "pylint", str(file_path), "--score=y"],
+                    capture_output=True,
+                    text=True,
+                    timeout=30
+                )
+            except (subprocess.TimeoutExpired, OSError):
+                return None
+            return _parse_score(result.stdout + result.stderr)
+        
+        try:
+            with _IN_PROCESS_LOCK:
+                # astroid caches modules by name; drop any stale tree for this file
+                # so rewritten content (same path, new code) is re-parsed
+                path_str = str(file_path)
+                stale = [name for name, module in ASTROID_MANAGER.astroid_cache.items()
+                         if getattr(module, "file", None) == path_str]
+                for name in stale:
+                    del ASTROID_MANAGER.astroid_cache[name]
+                run = PylintRun(
+                    [str(file_path), "--score=y"],
+                    reporter=TextReporter(io.StringIO()),
+                    exit=False
+                )
+            return float(run.linter.stats.global_note)
+        except Exception:
+            return None
+
     def run_on_directory(self, py_files: List[str]) -> Dict[str, Dict]:
         """
         Run pylint on multiple Python files.
@@ -0,0 +1,132 @@
+"""
+Pytest Worker
+Long-lived interpreter that runs pytest on request, so repeated test runs
+skip the Python startup and pytest import.
+
+Protocol (one JSON object per line):
+    stdin:  {"args": [...], "cwd": "...", "purge": "...", "tail_lines": 2000}
+    stdout: {"exit_code": int, "stdout": str, "stderr": str}
+
+Started by src.tools as a standalone script; it must not import the src package.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from collections import deque
+
+# Running as a script puts src/utils first on sys.path, where its modules
+# would shadow same-named sandbox modules
+if sys.path and os.path.abspath(sys.path[0]) == os.path.dirname(os.path.abspath(__file__)):
+    del sys.path[0]
+
+import pytest  # noqa: E402
+
+# Directory the worker returns to after each run. It is set at startup and
+# lies outside the sandbox, so it survives the sandbox being swapped out;
+# os.getcwd() would fail if the run's cwd had been deleted meanwhile
+_HOME_DIR = os.getcwd()
+
+
+def _purge_modules(root: str) -> None:
+    """Forget modules imported from root so edited sources are re-imported."""
+    prefix = os.path.join(os.path.abspath(root), "")
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.abspath(module_file).startswith(prefix):
+            del sys.modules[name]
+
+
+class _TailWriter(io.TextIOBase):
+    """Text sink that only keeps the last max_lines lines written to it."""
+
+    def __init__(self, max_lines: int):
+        self._lines = deque(maxlen=max_lines)
+        self._partial = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        lines = (self._partial + s).split("\n")
+        self._partial = lines.pop()
+        self._lines.extend(line + "\n" for line in lines)
+        return len(s)
+
+    def lines(self) -> list:
+        """The kept lines, the unterminated last one included."""
+        return list(self._lines) + ([self._partial] if self._partial else [])
+
+
+@contextlib.contextmanager
+def _capture_fd(fd: int, sink):
+    """Points fd at the sink file for the duration of the block."""
+    saved = os.dup(fd)
+    try:
+        os.dup2(sink.fileno(), fd)
+        yield
+    finally:
+        os.dup2(saved, fd)
+        os.close(saved)
+
+
+def _file_tail(raw, tail_lines: int) -> list:
+    """Last tail_lines lines of a binary file, decoded (read as a stream)."""
+    raw.seek(0)
+    return [line.decode("utf-8", "replace") for line in deque(raw, maxlen=tail_lines)]
+
+
+def _join_tail(lines: list, tail_lines: int) -> str:
+    return "".join(lines[-tail_lines:])
+
+
+def _run(request: dict) -> dict:
+    """Runs one pytest session as `python -m pytest <args>` would from cwd."""
+    cwd = request["cwd"]
+    tail_lines = request.get("tail_lines", 2000)
+    saved_path = list(sys.path)
+    # Python-level output goes to bounded sinks; whatever bypasses sys.stdout
+    # and sys.stderr (subprocesses, C extensions) lands in the raw files
+    out, err = _TailWriter(tail_lines), _TailWriter(tail_lines)
+    with tempfile.TemporaryFile() as raw_out, tempfile.TemporaryFile() as raw_err:
+        try:
+            os.chdir(cwd)
+            # `python -m` puts the working directory first on sys.path
+            sys.path.insert(0, cwd)
+            _purge_modules(request.get("purge") or cwd)
+            with _capture_fd(1, raw_out), _capture_fd(2, raw_err), \
+                    contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                exit_code = int(pytest.main(request["args"]))
+        finally:
+            sys.path[:] = saved_path
+            os.chdir(_HOME_DIR)
+
+        return {
+            "exit_code": exit_code,
+            "stdout": _join_tail(out.lines() + _file_tail(raw_out, tail_lines), tail_lines),
+            "stderr": _join_tail(err.lines() + _file_tail(raw_err, tail_lines), tail_lines),
+        }
+
+
+def main() -> None:
+    """Serves requests until stdin is closed."""
+    # Keep the real stdout for the protocol; fd 1 itself is pointed at
+    # stderr so stray writes between runs cannot corrupt it (during a run
+    # both fds are captured, see _run)
+    protocol = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+
+    for line in sys.stdin:
+        try:
+            response = _run(json.loads(line))
+        except BaseException as e:  # SystemExit from tests included
+            response = {"error": f"{type(e).__name__}: {e}"}
+        protocol.write(json.dumps(response) + "\n")
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    main()
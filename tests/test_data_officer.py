@@ -0,0 +1,50 @@
+"""
+Unit Tests for DataOfficer
+Tests that the quick verdict and the diagnostic scan agree.
+"""
+
+import json
+
+import pytest
+from src import data_officer
+from src.data_officer import DataOfficer
+
+
+def _entry(**overrides):
+    entry = {
+        'id': '1',
+        'timestamp': '2024-01-01T00:00:00',
+        'agent_name': 'Auditor',
+        'model_used': 'gemini-1.5-flash',
+        'action': 'CODE_ANALYSIS',
+        'details': {'input_prompt': 'Analyse this file', 'output_response': 'Looks fine'},
+        'status': 'SUCCESS',
+    }
+    entry.update(overrides)
+    return entry
+
+
+class TestDataOfficerSchema:
+    """Test validate_schema with and without early_exit."""
+
+    @pytest.mark.parametrize("entry", [
+        _entry(),
+        _entry(details=None),
+        _entry(details='not a dict'),
+        _entry(details={'input_prompt': 'Analyse this file'}),
+        _entry(action='UNKNOWN'),
+    ])
+    def test_early_exit_agrees_with_full_scan(self, tmp_path, monkeypatch, entry):
+        """Both validation paths must give the same verdict for every entry."""
+        log_file = tmp_path / "experiment_data.json"
+        log_file.write_text(json.dumps([entry]), encoding='utf-8')
+        monkeypatch.setattr(data_officer, "LOG_FILE", log_file)
+
+        quick = DataOfficer().validate_schema(early_exit=True)
+        officer = DataOfficer()
+        full = officer.validate_schema()
+
+        assert quick == full
+        assert full == (entry == _entry())
+        if not full:
+            assert officer.validation_issues
@@ -0,0 +1,39 @@
+"""
+Unit Tests for Orchestrator
+Tests concurrent runs over several directories.
+"""
+
+import time
+
+import pytest
+from src.orchestration.orchestrator import Orchestrator
+
+
+class _StatefulAgent:
+    """Agent that, like the real ones, keeps per-call state on self."""
+
+    def execute(self, directory, **kwargs):
+        self.target_dir = directory
+        time.sleep(0.05)  # let the other directory's run overwrite shared state
+        return {"status": "SUCCESS", "approved": True, "directory": self.target_dir}
+
+
+class TestOrchestratorRunBatch:
+    """Test run_batch / run_many."""
+
+    def test_run_batch_keeps_results_per_directory(self):
+        """Each result must come from its own directory, not a concurrent one."""
+        orchestrator = Orchestrator(_StatefulAgent(), _StatefulAgent(), _StatefulAgent())
+        directories = ["/fake/first", "/fake/second", "/fake/third"]
+
+        results = orchestrator.run_batch(directories)
+
+        assert len(results) == len(directories)
+        for directory, result in zip(directories, results):
+            assert result["status"] == "SUCCESS"
+            assert result["judge_result"]["directory"] == directory
+            assert all(step["result"]["directory"] == directory for step in result["history"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
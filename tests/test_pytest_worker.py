@@ -0,0 +1,70 @@
+"""
+Unit Tests for the pytest worker
+Tests that run_pytest sees sandbox edits and survives a crashing worker.
+"""
+
+import os
+import shutil
+
+import pytest
+from src import tools
+from src.tools import SANDBOX_DIR, run_pytest
+
+
+@pytest.fixture
+def sandbox_pkg():
+    """A scratch directory inside the sandbox, removed afterwards."""
+    path = os.path.join(SANDBOX_DIR, "_worker_test_pkg")
+    os.makedirs(path, exist_ok=True)
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _write(path, content):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+class TestPytestWorker:
+    """Test run_pytest through the long-lived worker."""
+
+    def test_second_run_sees_edited_module(self, sandbox_pkg):
+        """A module edited between two runs must be re-imported."""
+        _write(os.path.join(sandbox_pkg, "worker_target.py"), "def value():\n    return 1\n")
+        _write(
+            os.path.join(sandbox_pkg, "test_worker_target.py"),
+            "from worker_target import value\n\n\n"
+            "def test_value():\n    assert value() == 1\n",
+        )
+        test_path = os.path.join(sandbox_pkg, "test_worker_target.py")
+
+        first = run_pytest(test_path)
+        assert first["success"] is True
+        assert tools._pytest_worker is not None
+
+        _write(os.path.join(sandbox_pkg, "worker_target.py"), "def value():\n    return 2\n")
+        second = run_pytest(test_path)
+
+        assert second["success"] is False
+        assert second["failed"] == 1
+
+    def test_worker_crash_falls_back_to_fresh_interpreter(self, sandbox_pkg, monkeypatch):
+        """A test killing the worker must be rerun through _run_streaming."""
+        _write(
+            os.path.join(sandbox_pkg, "test_worker_crash.py"),
+            "import os\n\n\ndef test_crash():\n    os._exit(3)\n",
+        )
+        calls = []
+        real_run_streaming = tools._run_streaming
+
+        def recording_run_streaming(cmd, *args, **kwargs):
+            calls.append(cmd)
+            return real_run_streaming(cmd, *args, **kwargs)
+
+        monkeypatch.setattr(tools, "_run_streaming", recording_run_streaming)
+
+        result = run_pytest(os.path.join(sandbox_pkg, "test_worker_crash.py"))
+
+        assert len(calls) == 1
+        assert result["exit_code"] == 3
+        assert result["success"] is False
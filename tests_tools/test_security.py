@@ -9,7 +9,7 @@ This will test that:
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.tools import read_file, write_file, list_files, SANDBOX_DIR
+from src.tools import read_file, write_file, list_files, SANDBOX_DIR, execute_tool
 
 def test_secure_file_system():
     print("=" * 60)
@@ -92,5 +92,19 @@ def test_secure_file_system():
     print("TEST SUITE COMPLETED")
     print("=" * 60)
 
+def test_read_file_returns_written_content():
+    """read_file must return what write_file stored, directly and via execute_tool."""
+    write_file("read_check.py", "x = 1\n")
+    write_file("read_check_large.py", "y = 2\r\n" * 50000)  # above the mmap threshold
+    try:
+        assert read_file("read_check.py") == "x = 1\n"
+        assert read_file("read_check_large.py") == "y = 2\n" * 50000
+        result = execute_tool("read_file", path="read_check.py")
+        assert result["status"] == "success", result
+        assert result["output"] == "x = 1\n"
+    finally:
+        os.remove(os.path.join(SANDBOX_DIR, "read_check.py"))
+        os.remove(os.path.join(SANDBOX_DIR, "read_check_large.py"))
+
 if __name__ == "__main__":
     test_secure_file_system()